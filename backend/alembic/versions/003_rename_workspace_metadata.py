@@ -0,0 +1,26 @@
+"""Rename workspaces.metadata to extra_metadata
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # "metadata" collides with DeclarativeBase.metadata on the ORM side
+    op.alter_column('workspaces', 'metadata', new_column_name='extra_metadata')
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.alter_column('workspaces', 'extra_metadata', new_column_name='metadata')
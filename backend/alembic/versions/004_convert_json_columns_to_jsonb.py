@@ -0,0 +1,50 @@
+"""Convert workspace JSON columns to JSONB
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column)
+JSON_COLUMNS = (
+    ('workspaces', 'settings'),
+    ('workspaces', 'extra_metadata'),
+    ('workspace_members', 'permissions'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # JSONB is stored parsed, so reads skip re-parsing the text
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=postgresql.JSON(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,32 @@
+"""Add GIN index on workspaces.extra_metadata
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # jsonb_path_ops supports @> containment lookups with a smaller index
+    op.create_index(
+        'ix_workspaces_extra_metadata_gin',
+        'workspaces',
+        ['extra_metadata'],
+        postgresql_using='gin',
+        postgresql_ops={'extra_metadata': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_workspaces_extra_metadata_gin', table_name='workspaces')
@@ -0,0 +1,77 @@
+"""Store role and plan enums as smallint codes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, check constraint, values in code order, default value)
+# Codes are positions in the matching Python enum (see app.models.types.SmallIntEnum)
+ENUM_COLUMNS = (
+    ('users', 'role', 'userrole', 'ck_users_role', ('super_admin', 'admin', 'user'), 'user'),
+    (
+        'workspaces',
+        'plan',
+        'workspaceplan',
+        'ck_workspaces_plan',
+        ('free', 'pro', 'enterprise'),
+        'free',
+    ),
+    (
+        'workspace_members',
+        'role',
+        'workspacerole',
+        'ck_workspace_members_role',
+        ('owner', 'admin', 'member', 'viewer'),
+        'member',
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for table, column, enum_name, constraint, values, default in ENUM_COLUMNS:
+        cases = " ".join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(values))
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.SmallInteger(),
+            existing_type=postgresql.ENUM(*values, name=enum_name),
+            existing_nullable=False,
+            postgresql_using=f"CASE {column}::text {cases} END",
+        )
+        op.alter_column(table, column, server_default=sa.text(str(values.index(default))))
+        op.create_check_constraint(constraint, table, f"{column} BETWEEN 0 AND {len(values) - 1}")
+        # Nothing references the native type any more
+        postgresql.ENUM(*values, name=enum_name).drop(op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table, column, enum_name, constraint, values, default in ENUM_COLUMNS:
+        cases = " ".join(f"WHEN {code} THEN '{value}'" for code, value in enumerate(values))
+        enum_type = postgresql.ENUM(*values, name=enum_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.drop_constraint(constraint, table, type_='check')
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_type=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using=f"(CASE {column} {cases} END)::{enum_name}",
+        )
+        op.alter_column(table, column, server_default=default)
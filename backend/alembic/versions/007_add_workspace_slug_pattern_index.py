@@ -0,0 +1,31 @@
+"""Add pattern-ops index on workspaces.slug
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Lets "slug LIKE 'prefix-%'" collision lookups use an index scan
+    op.create_index(
+        'ix_workspaces_slug_pattern',
+        'workspaces',
+        ['slug'],
+        postgresql_ops={'slug': 'varchar_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_workspaces_slug_pattern', table_name='workspaces')
@@ -0,0 +1,54 @@
+"""Create system_metrics_hourly materialized view
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Hourly counts aggregated by Postgres; workspace_id is NULL for
+    # system-wide metrics
+    op.execute("""
+        CREATE MATERIALIZED VIEW system_metrics_hourly AS
+        SELECT date_trunc('hour', created_at) AS hour,
+               NULL::uuid AS workspace_id,
+               'users_registered'::text AS metric,
+               count(*) AS value
+        FROM users
+        GROUP BY 1
+        UNION ALL
+        SELECT date_trunc('hour', created_at),
+               NULL::uuid,
+               'workspaces_created'::text,
+               count(*)
+        FROM workspaces
+        GROUP BY 1
+        UNION ALL
+        SELECT date_trunc('hour', created_at),
+               workspace_id,
+               'members_added'::text,
+               count(*)
+        FROM workspace_members
+        GROUP BY 1, 2
+    """)
+    # REFRESH ... CONCURRENTLY requires a unique index covering all rows
+    op.execute("""
+        CREATE UNIQUE INDEX ix_system_metrics_hourly_key
+        ON system_metrics_hourly (hour, workspace_id, metric) NULLS NOT DISTINCT
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS system_metrics_hourly')
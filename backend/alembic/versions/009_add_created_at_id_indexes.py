@@ -0,0 +1,38 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Serve ORDER BY created_at, id ... LIMIT n listings from the index;
+    # created_at is not unique, so pages are keyed on (created_at, id)
+    op.create_index(
+        'ix_workspaces_owner_created',
+        'workspaces',
+        ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_workspace_members_ws_created',
+        'workspace_members',
+        ['workspace_id', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_workspace_members_ws_created', table_name='workspace_members')
+    op.drop_index('ix_workspaces_owner_created', table_name='workspaces')
@@ -0,0 +1,47 @@
+"""Add composite indexes to workspace_members
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # (user_id, workspace_id) enforces one membership per user and serves both
+    # "my memberships" and "is user X a member of workspace Y" lookups, so it
+    # replaces uq_workspace_member and the single-column user_id index
+    op.create_index(
+        'ix_workspace_members_user_workspace',
+        'workspace_members',
+        ['user_id', 'workspace_id'],
+        unique=True,
+    )
+    op.drop_constraint('uq_workspace_member', 'workspace_members', type_='unique')
+    op.drop_index('ix_workspace_members_user_id', table_name='workspace_members')
+    op.create_index(
+        'ix_workspace_members_workspace_role',
+        'workspace_members',
+        ['workspace_id', 'role'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_workspace_members_workspace_role', table_name='workspace_members')
+    op.create_index('ix_workspace_members_user_id', 'workspace_members', ['user_id'])
+    op.create_unique_constraint(
+        'uq_workspace_member',
+        'workspace_members',
+        ['workspace_id', 'user_id'],
+    )
+    op.drop_index('ix_workspace_members_user_workspace', table_name='workspace_members')
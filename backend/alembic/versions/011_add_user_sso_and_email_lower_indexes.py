@@ -0,0 +1,35 @@
+"""Add SSO identity and lower(email) indexes on users
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Case-insensitive email lookups match on lower(email)
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    op.create_index(
+        'ix_users_sso',
+        'users',
+        ['sso_provider', 'sso_external_id'],
+        unique=True,
+        postgresql_where=sa.text('sso_external_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_users_sso', table_name='users')
+    op.drop_index('ix_users_email_lower', table_name='users')
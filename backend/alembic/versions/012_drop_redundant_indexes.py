@@ -0,0 +1,39 @@
+"""Drop indexes duplicated by primary keys and composite indexes
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns)
+REDUNDANT_INDEXES = (
+    # Duplicates of the primary keys
+    ('ix_users_id', 'users', ['id']),
+    ('ix_workspaces_id', 'workspaces', ['id']),
+    ('ix_workspace_members_id', 'workspace_members', ['id']),
+    # Prefix of ix_workspaces_owner_created
+    ('ix_workspaces_owner_id', 'workspaces', ['owner_id']),
+    # Prefix of ix_workspace_members_workspace_role
+    ('ix_workspace_members_workspace_id', 'workspace_members', ['workspace_id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for name, table, _columns in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for name, table, columns in REDUNDANT_INDEXES:
+        op.create_index(name, table, columns)
@@ -1,9 +1,15 @@
 """Authentication API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.api.deps import get_current_active_user
+from app.api.deps import (
+    get_current_active_user,
+    invalidate_cached_token,
+    invalidate_cached_user,
+    security,
+)
 from app.models.user import User
 from app.schemas.auth import (
     RegisterRequest,
@@ -99,6 +105,7 @@ async def refresh_token(
 async def logout(
     refresh_token: str,
     current_user: User = Depends(get_current_active_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -107,6 +114,7 @@ async def logout(
     Args:
         refresh_token: Refresh token to revoke
         current_user: Current authenticated user
+        credentials: Bearer credentials of the current request
         db: Database session
 
     Returns:
@@ -114,6 +122,7 @@ async def logout(
     """
     auth_service = AuthService(db)
     await auth_service.logout_user(str(current_user.id), refresh_token)
+    invalidate_cached_token(credentials.credentials)
 
     return {"message": "Logged out successfully"}
 
@@ -199,6 +208,7 @@ async def reset_password(
     """
     auth_service = AuthService(db)
     user = await auth_service.reset_password(data.token, data.new_password)
+    invalidate_cached_user(user.id)
 
     return {
         "message": "Password reset successfully",
@@ -229,5 +239,6 @@ async def change_password(
         data.current_password,
         data.new_password,
     )
+    invalidate_cached_user(current_user.id)
 
     return {"message": "Password changed successfully"}
@@ -1,18 +1,85 @@
 """API dependency functions."""
-from typing import Optional
+import hashlib
+import time
+from typing import Optional, Tuple
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User, UserRole
+from app.schemas.auth import TokenPayload
 from app.utils.security import decode_token
 
-# HTTP Bearer token scheme
+# HTTP Bearer token schemes
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+# Role hierarchy: super_admin > admin > user
+_ROLE_LEVEL = {
+    UserRole.SUPER_ADMIN: 3,
+    UserRole.ADMIN: 2,
+    UserRole.USER: 1,
+}
+
+# Short-lived cache of authenticated users keyed by access token digest.
+# Values are (token expiry timestamp, detached User snapshot).
+#
+# The cache is per process. Logout, password reset and password change drop
+# entries only in the process that handled that request; with several API
+# workers, the others keep serving their snapshot for up to AUTH_CACHE_TTL
+# seconds, so a deactivated user or a role change can lag by that long.
+AUTH_CACHE_TTL = 30  # seconds
+_auth_cache: TTLCache = TTLCache(maxsize=10000, ttl=AUTH_CACHE_TTL)
+_USER_COLUMNS = inspect(User).column_attrs
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Digest an access token into a compact cache key."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_user(token: str) -> Optional[User]:
+    """Return the cached user for a token if present and the token is unexpired."""
+    entry: Optional[Tuple[int, User]] = _auth_cache.get(_token_cache_key(token))
+    if entry is None:
+        return None
+    exp, user = entry
+    if exp <= time.time():
+        return None
+    return user
+
+
+def _cache_user(token: str, payload: TokenPayload, user: User) -> None:
+    """Cache a detached snapshot of an authenticated user for a token."""
+    snapshot = User(**{attr.key: getattr(user, attr.key) for attr in _USER_COLUMNS})
+    _auth_cache[_token_cache_key(token)] = (payload.exp, snapshot)
+
+
+def invalidate_cached_token(token: str) -> None:
+    """
+    Drop a single access token from the auth cache.
+
+    Args:
+        token: Raw access token
+    """
+    _auth_cache.pop(_token_cache_key(token), None)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """
+    Drop every cached access token belonging to a user.
+
+    Args:
+        user_id: User ID
+    """
+    for key, (_, user) in list(_auth_cache.items()):
+        if user.id == user_id:
+            _auth_cache.pop(key, None)
 
 
 async def get_current_user(
@@ -34,6 +101,11 @@ async def get_current_user(
     """
     token = credentials.credentials
 
+    # Serve repeat tokens from the cache (only active users are cached)
+    user = _get_cached_user(token)
+    if user is not None:
+        return user
+
     # Decode token
     payload = decode_token(token, token_type="access")
     if not payload:
@@ -43,20 +115,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user ID from payload
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Get user from database
-    query = select(User).where(User.id == UUID(user_id))
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-
+    # Get user by primary key (served from the identity map when already loaded)
+    user = await db.get(User, payload.sub)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -70,6 +130,8 @@ async def get_current_user(
             detail="User account is inactive",
         )
 
+    _cache_user(token, payload, user)
+
     return user
 
 
@@ -129,17 +191,11 @@ def require_role(required_role: UserRole):
     Returns:
         Dependency function
     """
+    required_level = _ROLE_LEVEL[required_role]
+
     async def role_checker(current_user: User = Depends(get_current_active_user)) -> User:
         """Check if user has required role."""
-        # Role hierarchy: super_admin > admin > user
-        role_hierarchy = {
-            UserRole.SUPER_ADMIN: 3,
-            UserRole.ADMIN: 2,
-            UserRole.USER: 1,
-        }
-
-        user_level = role_hierarchy.get(current_user.role, 0)
-        required_level = role_hierarchy.get(required_role, 0)
+        user_level = _ROLE_LEVEL.get(current_user.role, 0)
 
         if user_level < required_level:
             raise HTTPException(
@@ -169,7 +225,7 @@ async def require_super_admin(
 
 
 async def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     db: AsyncSession = Depends(get_db),
 ) -> Optional[User]:
     """
@@ -189,18 +245,19 @@ async def get_optional_user(
 
     try:
         token = credentials.credentials
+        user = _get_cached_user(token)
+        if user is not None:
+            return user
+
         payload = decode_token(token, token_type="access")
         if not payload:
             return None
 
-        user_id = payload.get("sub")
-        if not user_id:
-            return None
-
-        query = select(User).where(User.id == UUID(user_id))
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
+        user = await db.get(User, payload.sub)
 
-        return user if user and user.is_active else None
+        if user and user.is_active:
+            _cache_user(token, payload, user)
+            return user
+        return None
     except Exception:
         return None
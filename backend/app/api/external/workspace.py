@@ -1,13 +1,15 @@
 """Workspace management API endpoints."""
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
 from app.database import get_db
 from app.models.user import User
-from app.services.workspace import WorkspaceService
+from app.services.workspace import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, WorkspaceService
 from app.schemas.workspace import (
     WorkspaceCreate,
     WorkspaceUpdate,
@@ -19,6 +21,43 @@ from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/workspaces", tags=["workspaces"])
 
+# Validates a whole member list from ORM objects in one pydantic-core call
+_MEMBER_LIST_ADAPTER = TypeAdapter(List[WorkspaceMemberResponse])
+
+
+def _page_cursor(
+    after: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
+) -> Optional[Tuple[datetime, UUID]]:
+    """
+    Build a keyset cursor from the last item of the previous page.
+
+    Both the item's created_at (``after``) and id (``after_id``) are needed,
+    since created_at alone is not unique.
+
+    Raises:
+        HTTPException: If only one of the two parameters is given
+    """
+    if after is None and after_id is None:
+        return None
+    if after is None or after_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after and after_id must be given together",
+        )
+    return after, after_id
+
+
+def _set_next_page_link(
+    request: Request,
+    response: Response,
+    created_at: datetime,
+    item_id: UUID,
+) -> None:
+    """Point a ``Link: <...>; rel="next"`` header at the page after an item."""
+    next_url = request.url.include_query_params(after=created_at.isoformat(), after_id=item_id)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+
 
 @router.post("", response_model=WorkspaceResponse, status_code=status.HTTP_201_CREATED)
 async def create_workspace(
@@ -34,56 +73,38 @@ async def create_workspace(
     service = WorkspaceService(db)
     workspace = await service.create_workspace(data, current_user.id)
 
-    return WorkspaceResponse(
-        id=workspace.id,
-        name=workspace.name,
-        slug=workspace.slug,
-        owner_id=workspace.owner_id,
-        plan=workspace.plan.value,
-        sso_enabled=workspace.sso_enabled,
-        sso_enforced=workspace.sso_enforced,
-        settings=workspace.settings or {},
-        metadata=workspace.metadata or {},
-        created_at=workspace.created_at,
-        updated_at=workspace.updated_at,
-        members=[],
-    )
+    return WorkspaceResponse.from_orm_row(workspace)
 
 
 @router.get("", response_model=List[WorkspaceResponse])
 async def list_workspaces(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[Tuple[datetime, UUID]] = Depends(_page_cursor),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    List all workspaces the current user is a member of.
+    List workspaces the current user is a member of, newest first.
+
+    Returns at most ``limit`` workspaces (default 50). When the page is full,
+    a ``Link: <...>; rel="next"`` header points at the next page; following
+    it passes the created_at and id of the last workspace as ``after`` and
+    ``after_id``.
     """
     service = WorkspaceService(db)
-    workspaces = await service.get_user_workspaces(current_user.id)
-
-    # For each workspace, get the user's role
-    result = []
-    for workspace in workspaces:
-        role = await service.get_user_workspace_role(workspace.id, current_user.id)
-        result.append(
-            WorkspaceResponse(
-                id=workspace.id,
-                name=workspace.name,
-                slug=workspace.slug,
-                owner_id=workspace.owner_id,
-                plan=workspace.plan.value,
-                sso_enabled=workspace.sso_enabled,
-                sso_enforced=workspace.sso_enforced,
-                settings=workspace.settings or {},
-                metadata=workspace.metadata or {},
-                created_at=workspace.created_at,
-                updated_at=workspace.updated_at,
-                members=[],
-                user_role=role.value if role else None,
-            )
-        )
+    rows = await service.get_user_workspaces_with_roles(
+        current_user.id, limit=limit, after=after
+    )
+    if len(rows) == limit:
+        last, _ = rows[-1]
+        _set_next_page_link(request, response, last.created_at, last.id)
 
-    return result
+    return [
+        WorkspaceResponse.from_orm_row(workspace, role)
+        for workspace, role in rows
+    ]
 
 
 @router.get("/{workspace_id}", response_model=WorkspaceResponse)
@@ -98,55 +119,21 @@ async def get_workspace(
     User must be a member of the workspace.
     """
     service = WorkspaceService(db)
+    workspace, role = await service.get_workspace_with_context(workspace_id, current_user.id)
 
-    # Check if user has access
-    has_access = await service.check_workspace_permission(workspace_id, current_user.id)
-    if not has_access:
+    # Non-members (and unknown workspaces) get the same 403
+    if workspace is None or role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have access to this workspace",
         )
 
-    workspace = await service.get_workspace(workspace_id)
-    if not workspace:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Workspace not found",
-        )
-
-    # Get user's role
-    role = await service.get_user_workspace_role(workspace_id, current_user.id)
-
-    # Get members
-    members = await service.get_workspace_members(workspace_id)
-    member_responses = [
-        WorkspaceMemberResponse(
-            id=member.id,
-            workspace_id=member.workspace_id,
-            user_id=member.user_id,
-            role=member.role.value,
-            permissions=member.permissions or {},
-            created_at=member.created_at,
-        )
-        for member in members
-    ]
-
-    return WorkspaceResponse(
-        id=workspace.id,
-        name=workspace.name,
-        slug=workspace.slug,
-        owner_id=workspace.owner_id,
-        plan=workspace.plan.value,
-        sso_enabled=workspace.sso_enabled,
-        sso_enforced=workspace.sso_enforced,
-        settings=workspace.settings or {},
-        metadata=workspace.metadata or {},
-        created_at=workspace.created_at,
-        updated_at=workspace.updated_at,
-        members=member_responses,
-        user_role=role.value if role else None,
+    member_responses = _MEMBER_LIST_ADAPTER.validate_python(
+        workspace.members, from_attributes=True
     )
 
+    return WorkspaceResponse.from_orm_row(workspace, role, member_responses)
+
 
 @router.patch("/{workspace_id}", response_model=WorkspaceResponse)
 async def update_workspace(
@@ -166,21 +153,7 @@ async def update_workspace(
     # Get user's role
     role = await service.get_user_workspace_role(workspace_id, current_user.id)
 
-    return WorkspaceResponse(
-        id=workspace.id,
-        name=workspace.name,
-        slug=workspace.slug,
-        owner_id=workspace.owner_id,
-        plan=workspace.plan.value,
-        sso_enabled=workspace.sso_enabled,
-        sso_enforced=workspace.sso_enforced,
-        settings=workspace.settings or {},
-        metadata=workspace.metadata or {},
-        created_at=workspace.created_at,
-        updated_at=workspace.updated_at,
-        members=[],
-        user_role=role.value if role else None,
-    )
+    return WorkspaceResponse.from_orm_row(workspace, role)
 
 
 @router.delete("/{workspace_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -202,13 +175,20 @@ async def delete_workspace(
 @router.get("/{workspace_id}/members", response_model=List[WorkspaceMemberResponse])
 async def list_workspace_members(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[Tuple[datetime, UUID]] = Depends(_page_cursor),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    List all members of a workspace.
+    List members of a workspace, oldest first.
 
-    User must be a member of the workspace.
+    User must be a member of the workspace. Returns at most ``limit``
+    members (default 50). When the page is full, a ``Link: <...>; rel="next"``
+    header points at the next page; following it passes the created_at and
+    id of the last member as ``after`` and ``after_id``.
     """
     service = WorkspaceService(db)
 
@@ -220,19 +200,11 @@ async def list_workspace_members(
             detail="You do not have access to this workspace",
         )
 
-    members = await service.get_workspace_members(workspace_id)
+    members = await service.get_workspace_members(workspace_id, limit=limit, after=after)
+    if len(members) == limit:
+        _set_next_page_link(request, response, members[-1].created_at, members[-1].id)
 
-    return [
-        WorkspaceMemberResponse(
-            id=member.id,
-            workspace_id=member.workspace_id,
-            user_id=member.user_id,
-            role=member.role.value,
-            permissions=member.permissions or {},
-            created_at=member.created_at,
-        )
-        for member in members
-    ]
+    return _MEMBER_LIST_ADAPTER.validate_python(members, from_attributes=True)
 
 
 @router.post(
@@ -254,14 +226,7 @@ async def add_workspace_member(
     service = WorkspaceService(db)
     member = await service.add_member(workspace_id, data, current_user.id)
 
-    return WorkspaceMemberResponse(
-        id=member.id,
-        workspace_id=member.workspace_id,
-        user_id=member.user_id,
-        role=member.role.value,
-        permissions=member.permissions or {},
-        created_at=member.created_at,
-    )
+    return WorkspaceMemberResponse.model_validate(member)
 
 
 @router.delete(
@@ -297,7 +262,7 @@ async def get_workspace_by_slug(
     User must be a member of the workspace.
     """
     service = WorkspaceService(db)
-    workspace = await service.get_workspace_by_slug(slug)
+    workspace, role = await service.get_workspace_by_slug_with_context(slug, current_user.id)
 
     if not workspace:
         raise HTTPException(
@@ -306,42 +271,14 @@ async def get_workspace_by_slug(
         )
 
     # Check if user has access
-    has_access = await service.check_workspace_permission(workspace.id, current_user.id)
-    if not has_access:
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have access to this workspace",
         )
 
-    # Get user's role
-    role = await service.get_user_workspace_role(workspace.id, current_user.id)
-
-    # Get members
-    members = await service.get_workspace_members(workspace.id)
-    member_responses = [
-        WorkspaceMemberResponse(
-            id=member.id,
-            workspace_id=member.workspace_id,
-            user_id=member.user_id,
-            role=member.role.value,
-            permissions=member.permissions or {},
-            created_at=member.created_at,
-        )
-        for member in members
-    ]
-
-    return WorkspaceResponse(
-        id=workspace.id,
-        name=workspace.name,
-        slug=workspace.slug,
-        owner_id=workspace.owner_id,
-        plan=workspace.plan.value,
-        sso_enabled=workspace.sso_enabled,
-        sso_enforced=workspace.sso_enforced,
-        settings=workspace.settings or {},
-        metadata=workspace.metadata or {},
-        created_at=workspace.created_at,
-        updated_at=workspace.updated_at,
-        members=member_responses,
-        user_role=role.value if role else None,
+    member_responses = _MEMBER_LIST_ADAPTER.validate_python(
+        workspace.members, from_attributes=True
     )
+
+    return WorkspaceResponse.from_orm_row(workspace, role, member_responses)
@@ -11,35 +11,64 @@ celery_app = Celery(
         "app.tasks.email",
         "app.tasks.analytics",
         "app.tasks.cleanup",
+        "app.tasks.user",
     ],
 )
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    task_compression="zstd",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
+    # No caller reads task results; tasks that return one opt back in
+    task_ignore_result=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
-    worker_prefetch_multiplier=4,
+    # Conservative default for CPU-bound workers; I/O workers raise it with
+    # --prefetch-multiplier on the command line
+    worker_prefetch_multiplier=1,
+    worker_pool="prefork",
+    worker_pool_restarts=True,
+    # Recycle a child after 1000 tasks or once its RSS exceeds ~200MB (in KiB),
+    # whichever comes first
     worker_max_tasks_per_child=1000,
+    worker_max_memory_per_child=200000,
 )
 
+# Route tasks to queues by workload so each worker pool can be tuned separately.
+# I/O tasks hand their coroutines to one event loop per process
+# (app.tasks._loop), so the io worker can run them from a threads pool:
+#   celery -A app.celery_app worker -Q io,celery --pool=threads --concurrency=32 \
+#       --prefetch-multiplier=4
+#   celery -A app.celery_app worker -Q cpu --prefetch-multiplier=1
+# Cleanup only waits on the database, Redis and the filesystem, so it shares
+# the I/O pool with email.
+celery_app.conf.task_routes = {
+    "app.tasks.email.*": {"queue": "io"},
+    "app.tasks.analytics.*": {"queue": "cpu"},
+    "app.tasks.cleanup.*": {"queue": "io"},
+    "app.tasks.user.*": {"queue": "io"},
+}
+
 # Beat schedule for periodic tasks
 celery_app.conf.beat_schedule = {
     "cleanup-expired-tokens": {
         "task": "app.tasks.cleanup.cleanup_expired_tokens",
         "schedule": 3600.0,  # Every hour
+        "options": {"ignore_result": True},
     },
     "cleanup-old-audit-logs": {
         "task": "app.tasks.cleanup.cleanup_old_audit_logs",
         "schedule": 86400.0,  # Every day
+        "options": {"ignore_result": True},
     },
     "process-analytics": {
         "task": "app.tasks.analytics.process_analytics",
         "schedule": 300.0,  # Every 5 minutes
+        "options": {"ignore_result": True},
     },
 }
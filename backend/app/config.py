@@ -1,9 +1,25 @@
 """Application configuration using Pydantic Settings."""
-from typing import List
-from pydantic import PostgresDsn, RedisDsn, field_validator
+from functools import cached_property, lru_cache
+from typing import Annotated, Any, FrozenSet, Tuple, Union
+from pydantic import BeforeValidator, PostgresDsn, RedisDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _split_comma_separated(v: Any) -> Any:
+    """Parse a comma-separated string into a tuple of stripped values."""
+    if isinstance(v, str):
+        return tuple(item.strip() for item in v.split(","))
+    return v
+
+
+# The str arm only stops pydantic-settings from JSON-decoding the raw env
+# value; the validator always produces a tuple.
+CommaSeparatedTuple = Annotated[
+    Union[Tuple[str, ...], str],
+    BeforeValidator(_split_comma_separated),
+]
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -16,6 +32,11 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: PostgresDsn
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_ECHO: bool = False
 
     # Redis
     REDIS_URL: RedisDsn
@@ -31,13 +52,12 @@ class Settings(BaseSettings):
     ENCRYPTION_KEY: str
 
     # CORS
-    CORS_ORIGINS: str = "http://localhost:3000"
+    CORS_ORIGINS: CommaSeparatedTuple = "http://localhost:3000"
 
-    @field_validator("CORS_ORIGINS")
-    @classmethod
-    def parse_cors_origins(cls, v: str) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in v.split(",")]
+    @cached_property
+    def CORS_ORIGINS_SET(self) -> FrozenSet[bytes]:
+        """Lowercased CORS origins as header bytes for ASGI-level matching."""
+        return frozenset(origin.lower().encode("latin-1") for origin in self.CORS_ORIGINS)
 
     # Email (optional)
     SMTP_HOST: str = ""
@@ -47,6 +67,8 @@ class Settings(BaseSettings):
     SMTP_FROM: str = "noreply@adminory.dev"
     SMTP_TLS: bool = True
     SMTP_SSL: bool = False
+    SMTP_POOL_SIZE: int = 5
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
 
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
@@ -80,13 +102,7 @@ class Settings(BaseSettings):
 
     # Security
     SECRET_KEY: str
-    ALLOWED_HOSTS: str = "localhost,127.0.0.1"
-
-    @field_validator("ALLOWED_HOSTS")
-    @classmethod
-    def parse_allowed_hosts(cls, v: str) -> List[str]:
-        """Parse allowed hosts from comma-separated string."""
-        return [host.strip() for host in v.split(",")]
+    ALLOWED_HOSTS: CommaSeparatedTuple = "localhost,127.0.0.1"
 
     # Feature Flags
     FEATURE_SSO_SAML: bool = True
@@ -101,5 +117,19 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings.
+
+    Settings are parsed once and cached, so this can be used as a
+    FastAPI dependency without re-reading the environment.
+
+    Returns:
+        Cached settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
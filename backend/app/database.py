@@ -1,5 +1,6 @@
 """Database configuration and session management."""
 from typing import AsyncGenerator
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.config import settings
@@ -10,11 +11,21 @@ DATABASE_URL = str(settings.DATABASE_URL).replace("postgresql://", "postgresql+a
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=settings.DB_ECHO,
     future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    # Production relies on pool_recycle instead of a ping per checkout
+    pool_pre_ping=settings.ENVIRONMENT == "development",
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Larger compiled-statement LRU than the default 500 entries
+    query_cache_size=1200,
+    connect_args={
+        # asyncpg server-side prepared statement cache (per connection)
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # SQLAlchemy asyncpg dialect cache of prepared statement handles
+        "prepared_statement_cache_size": 256,
+    },
 )
 
 # Create async session factory
@@ -45,7 +56,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
-    """Initialize database tables."""
+    """
+    Initialize database tables.
+
+    In production the schema is managed by Alembic, so only connectivity
+    is checked. Other environments create missing tables on startup.
+    """
+    if settings.ENVIRONMENT == "production":
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
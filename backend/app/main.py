@@ -1,13 +1,19 @@
 """FastAPI application entry point."""
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
+from app.api import auth
+from app.api.external import workspace
 from app.config import settings
 from app.database import init_db, close_db
+from app.middleware.cors import FastCORSMiddleware
+from app.middleware.workspace import WorkspaceContextMiddleware
 from app.redis import close_redis
+from app.utils.security_pool import shutdown_pool, start_pool
 
 
 @asynccontextmanager
@@ -25,12 +31,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await init_db()
     logger.info("Database initialized")
 
+    start_pool()
+
+    # Build the OpenAPI schema now instead of on the first /openapi.json request
+    app.openapi()
+
     yield
 
     # Shutdown
     logger.info("Shutting down Adminory application...")
     await close_db()
     await close_redis()
+    await asyncio.to_thread(shutdown_pool)
     logger.info("Cleanup complete")
 
 
@@ -42,20 +54,14 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FastCORSMiddleware, allow_origins=settings.CORS_ORIGINS_SET)
 
 # Workspace context middleware
-from app.middleware.workspace import workspace_context_middleware
-app.middleware("http")(workspace_context_middleware)
+app.add_middleware(WorkspaceContextMiddleware)
 
 
 @app.get("/")
@@ -79,9 +85,6 @@ async def health() -> dict:
 
 
 # Include API routers
-from app.api import auth
-from app.api.external import workspace
-
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(workspace.router, prefix="/api/external", tags=["workspace"])
 
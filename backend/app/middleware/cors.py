@@ -0,0 +1,137 @@
+"""CORS middleware."""
+from typing import Iterable, List, Optional, Tuple, Union
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+
+
+class FastCORSMiddleware:
+    """
+    Pure ASGI CORS middleware.
+
+    Requests without an Origin header (same-origin calls, server-to-server
+    traffic) are passed straight through. Allowed origins are kept as a
+    frozenset of header bytes so matching is a single set lookup.
+
+    Behaves like Starlette's CORSMiddleware configured with
+    allow_credentials=True and wildcard methods and headers.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Iterable[Union[str, bytes]] = ()):
+        self.app = app
+        self.allow_origins = frozenset(
+            origin if isinstance(origin, bytes) else origin.lower().encode("latin-1")
+            for origin in allow_origins
+        )
+        self.allow_all_origins = b"*" in self.allow_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a CORS request
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight_response(origin, request_headers, send)
+            return
+
+        if not self.is_allowed_origin(origin):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = self.add_cors_headers(list(message.get("headers", ())), origin)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def is_allowed_origin(self, origin: bytes) -> bool:
+        """
+        Check if origin is allowed.
+
+        Args:
+            origin: Origin header value
+
+        Returns:
+            True if the origin may access the API
+        """
+        return self.allow_all_origins or origin in self.allow_origins
+
+    async def preflight_response(
+        self,
+        origin: bytes,
+        request_headers: Optional[bytes],
+        send: Send,
+    ) -> None:
+        """
+        Answer a preflight request without invoking the application.
+
+        Args:
+            origin: Origin header value
+            request_headers: Access-Control-Request-Headers value, if any
+            send: ASGI send callable
+        """
+        if self.is_allowed_origin(origin):
+            status = 200
+            body = b"OK"
+            headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"access-control-allow-methods", ALLOW_METHODS),
+                (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+                (b"vary", b"Origin"),
+            ]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+        else:
+            status = 400
+            body = b"Disallowed CORS origin"
+            headers = [(b"vary", b"Origin")]
+
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def add_cors_headers(
+        headers: List[Tuple[bytes, bytes]],
+        origin: bytes,
+    ) -> List[Tuple[bytes, bytes]]:
+        """
+        Add CORS headers to a simple (non-preflight) response.
+
+        Args:
+            headers: Raw response headers
+            origin: Allowed origin to echo back
+
+        Returns:
+            Headers with CORS headers appended
+        """
+        for index, (name, value) in enumerate(headers):
+            if name.lower() == b"vary":
+                headers[index] = (name, value + b", Origin")
+                break
+        else:
+            headers.append((b"vary", b"Origin"))
+        headers.append((b"access-control-allow-origin", origin))
+        headers.append((b"access-control-allow-credentials", b"true"))
+        return headers
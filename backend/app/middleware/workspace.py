@@ -1,69 +1,126 @@
 """Workspace context middleware."""
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import unquote_plus
 from uuid import UUID
 from fastapi import Request, HTTPException, status
 from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class WorkspaceContext:
+class WorkspaceContextMiddleware:
     """
-    Workspace context for request.
-
-    This can be accessed via request.state.workspace_id in route handlers.
-    """
-
-    def __init__(self):
-        self.workspace_id: Optional[UUID] = None
-
-
-async def workspace_context_middleware(request: Request, call_next):
-    """
-    Middleware to extract workspace context from request.
+    Pure ASGI middleware to extract workspace context from request.
 
     Workspace can be provided via:
     1. X-Workspace-ID header
     2. workspace_id query parameter
     3. Path parameter (for workspace-specific routes)
 
-    Sets request.state.workspace_id if workspace is specified.
+    Sets scope["state"]["workspace_id"] (exposed as request.state.workspace_id).
+    Headers and query string are read straight from the ASGI scope, so no
+    Request/Response objects are built per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        workspace_id = None
+
+        # Try to get from header
+        for name, value in scope["headers"]:
+            if name == b"x-workspace-id":
+                workspace_id = _parse_uuid_bytes(value)
+                if workspace_id is None:
+                    logger.opt(lazy=True).warning(
+                        "Invalid workspace ID in header: {}", lambda: value.decode("latin-1")
+                    )
+                break
+
+        # Try to get from query parameter if not in header
+        if not workspace_id:
+            workspace_query = _get_query_param(scope.get("query_string", b""), b"workspace_id")
+            if workspace_query:
+                # Characters outside latin-1 cannot be part of a UUID; replace
+                # them so the value is rejected below instead of raising
+                workspace_id = _parse_uuid_bytes(
+                    workspace_query.encode("latin-1", errors="replace")
+                )
+                if workspace_id is None:
+                    logger.warning("Invalid workspace ID in query: {}", workspace_query)
+
+        # Set in request state
+        scope.setdefault("state", {})["workspace_id"] = workspace_id
+
+        await self.app(scope, receive, send)
+
+
+@lru_cache(maxsize=1024)
+def _parse_uuid_bytes(value: bytes) -> Optional[UUID]:
     """
-    workspace_id = None
+    Parse a UUID from raw header bytes.
 
-    # Try to get from header
-    workspace_header = request.headers.get("X-Workspace-ID")
-    if workspace_header:
-        try:
-            workspace_id = UUID(workspace_header)
-        except ValueError:
-            logger.warning(f"Invalid workspace ID in header: {workspace_header}")
+    Accepts the 36-character hyphenated form and the 32-character hex form.
+    Results are cached since clients send the same workspace ID repeatedly.
 
-    # Try to get from query parameter if not in header
-    if not workspace_id:
-        workspace_query = request.query_params.get("workspace_id")
-        if workspace_query:
-            try:
-                workspace_id = UUID(workspace_query)
-            except ValueError:
-                logger.warning(f"Invalid workspace ID in query: {workspace_query}")
+    Args:
+        value: Raw UUID bytes
 
-    # Set in request state
-    request.state.workspace_id = workspace_id
+    Returns:
+        Parsed UUID or None if the value is not a valid UUID
+    """
+    if len(value) == 36:
+        if value[8] != 45 or value[13] != 45 or value[18] != 45 or value[23] != 45:
+            return None
+        value = value.replace(b"-", b"")
+    elif len(value) != 32:
+        return None
+    try:
+        return UUID(bytes=bytes.fromhex(value.decode("ascii")))
+    except ValueError:
+        return None
+
+
+def _get_query_param(query_string: bytes, name: bytes) -> Optional[str]:
+    """
+    Get the first value of a query parameter from a raw query string.
 
-    response = await call_next(request)
-    return response
+    Args:
+        query_string: Raw ASGI query string
+        name: Parameter name
+
+    Returns:
+        Decoded parameter value or None
+    """
+    if name not in query_string:
+        return None
+    prefix = name + b"="
+    for pair in query_string.split(b"&"):
+        if pair.startswith(prefix):
+            return unquote_plus(pair[len(prefix):].decode("latin-1"))
+    return None
 
 
 def get_workspace_id_from_request(request: Request) -> Optional[UUID]:
     """
     Get workspace ID from request state.
 
+    The value is written to scope["state"]["workspace_id"] by
+    WorkspaceContextMiddleware.
+
     Args:
         request: FastAPI request
 
     Returns:
         Workspace UUID or None
     """
-    return getattr(request.state, "workspace_id", None)
+    state = request.scope.get("state")
+    return state.get("workspace_id") if state else None
 
 
 def require_workspace_context(request: Request) -> UUID:
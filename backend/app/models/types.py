@@ -0,0 +1,38 @@
+"""Custom SQLAlchemy column types."""
+import enum
+from typing import Any, Optional, Type
+from sqlalchemy import SmallInteger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python enum as a SMALLINT code.
+
+    Each member is stored as its position in the enum definition, so new
+    members must only ever be appended.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[enum.Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    @property
+    def python_type(self) -> Type[enum.Enum]:
+        return self.enum_class
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[int], dialect: Dialect) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        return self._members[value]
@@ -1,13 +1,17 @@
 """User model."""
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import Boolean, String, DateTime, Enum as SQLEnum
+from functools import cached_property
+from operator import attrgetter
+from typing import Any, Dict, Optional
+from sqlalchemy import Boolean, CheckConstraint, String, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 import uuid
 import enum
 
 from app.database import Base
+from app.models.types import SmallIntEnum
+from app.utils.helpers import uuid7
 
 
 class UserRole(str, enum.Enum):
@@ -21,12 +25,24 @@ class User(Base):
     """User model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        CheckConstraint("role BETWEEN 0 AND 2", name="ck_users_role"),
+        Index("ix_users_email_lower", text("lower(email)"), unique=True),
+        Index(
+            "ix_users_sso",
+            "sso_provider",
+            "sso_external_id",
+            unique=True,
+            postgresql_where=text("sso_external_id IS NOT NULL"),
+        ),
+    )
+    # Fetch server-generated timestamps via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        default=uuid7,
     )
     email: Mapped[str] = mapped_column(
         String(255),
@@ -41,8 +57,9 @@ class User(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     avatar_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     role: Mapped[UserRole] = mapped_column(
-        SQLEnum(UserRole),
+        SmallIntEnum(UserRole),
         default=UserRole.USER,
+        server_default=text("2"),
         nullable=False
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -61,13 +78,13 @@ class User(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -76,18 +93,39 @@ class User(Base):
         """String representation."""
         return f"<User {self.email}>"
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
+    @cached_property
+    def token_claims(self) -> Dict[str, Any]:
+        """Identity claims for JWTs, built once per instance."""
         return {
-            "id": str(self.id),
+            "sub": str(self.id),
             "email": self.email,
-            "name": self.name,
-            "avatar_url": self.avatar_url,
             "role": self.role.value,
-            "is_active": self.is_active,
-            "email_verified_at": self.email_verified_at.isoformat() if self.email_verified_at else None,
-            "sso_provider": self.sso_provider,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None,
         }
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            key: fmt(getter(self)) if fmt else getter(self)
+            for key, getter, fmt in _USER_DICT_SPEC
+        }
+
+
+def _iso_or_none(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as ISO 8601."""
+    return value.isoformat() if value is not None else None
+
+
+# (key, getter, formatter) triples used by User.to_dict
+_USER_DICT_SPEC = (
+    ("id", attrgetter("id"), str),
+    ("email", attrgetter("email"), None),
+    ("name", attrgetter("name"), None),
+    ("avatar_url", attrgetter("avatar_url"), None),
+    ("role", attrgetter("role.value"), None),
+    ("is_active", attrgetter("is_active"), None),
+    ("email_verified_at", attrgetter("email_verified_at"), _iso_or_none),
+    ("sso_provider", attrgetter("sso_provider"), None),
+    ("created_at", attrgetter("created_at"), datetime.isoformat),
+    ("updated_at", attrgetter("updated_at"), datetime.isoformat),
+    ("last_login_at", attrgetter("last_login_at"), _iso_or_none),
+)
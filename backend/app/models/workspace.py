@@ -1,13 +1,16 @@
 """Workspace and WorkspaceMember models."""
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Boolean, String, DateTime, ForeignKey, Enum as SQLEnum, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, CheckConstraint, String, DateTime, ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 import enum
 
 from app.database import Base
+from app.models.types import SmallIntEnum
+from app.utils.helpers import uuid7
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -32,12 +35,28 @@ class Workspace(Base):
     """Workspace model for multi-tenancy."""
 
     __tablename__ = "workspaces"
+    __table_args__ = (
+        CheckConstraint("plan BETWEEN 0 AND 2", name="ck_workspaces_plan"),
+        Index("ix_workspaces_owner_created", "owner_id", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_workspaces_slug_pattern",
+            "slug",
+            postgresql_ops={"slug": "varchar_pattern_ops"},
+        ),
+        Index(
+            "ix_workspaces_extra_metadata_gin",
+            "extra_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"extra_metadata": "jsonb_path_ops"},
+        ),
+    )
+    # Fetch server-generated timestamps via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        default=uuid7,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     slug: Mapped[str] = mapped_column(
@@ -50,11 +69,11 @@ class Workspace(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id"),
         nullable=False,
-        index=True
     )
     plan: Mapped[WorkspacePlan] = mapped_column(
-        SQLEnum(WorkspacePlan),
+        SmallIntEnum(WorkspacePlan),
         default=WorkspacePlan.FREE,
+        server_default=text("0"),
         nullable=False
     )
 
@@ -67,25 +86,29 @@ class Workspace(Base):
     )
 
     # JSON fields for flexible data
-    settings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    settings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
     # Relationships
     # owner = relationship("User", back_populates="owned_workspaces")
-    # members = relationship("WorkspaceMember", back_populates="workspace", cascade="all, delete-orphan")
+    members: Mapped[list["WorkspaceMember"]] = relationship(
+        back_populates="workspace",
+        order_by="WorkspaceMember.created_at",
+        passive_deletes=True,  # rows are removed by ON DELETE CASCADE
+    )
 
     def __repr__(self) -> str:
         """String representation."""
@@ -94,17 +117,8 @@ class Workspace(Base):
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "id": str(self.id),
-            "name": self.name,
-            "slug": self.slug,
-            "owner_id": str(self.owner_id),
-            "plan": self.plan.value,
-            "sso_enabled": self.sso_enabled,
-            "sso_enforced": self.sso_enforced,
-            "settings": self.settings or {},
-            "metadata": self.metadata or {},
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            key: fmt(getter(self)) if fmt else getter(self)
+            for key, getter, fmt in _WORKSPACE_DICT_SPEC
         }
 
 
@@ -112,43 +126,54 @@ class WorkspaceMember(Base):
     """Workspace member model for managing team members."""
 
     __tablename__ = "workspace_members"
+    __table_args__ = (
+        CheckConstraint("role BETWEEN 0 AND 3", name="ck_workspace_members_role"),
+        Index("ix_workspace_members_user_workspace", "user_id", "workspace_id", unique=True),
+        Index("ix_workspace_members_workspace_role", "workspace_id", "role"),
+        Index(
+            "ix_workspace_members_ws_created",
+            "workspace_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
+    # Fetch server-generated timestamps via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        default=uuid7,
     )
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     role: Mapped[WorkspaceRole] = mapped_column(
-        SQLEnum(WorkspaceRole),
+        SmallIntEnum(WorkspaceRole),
         default=WorkspaceRole.MEMBER,
+        server_default=text("2"),
         nullable=False
     )
 
     # Custom permissions (JSON)
-    permissions: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    permissions: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
     # Relationships
-    # workspace = relationship("Workspace", back_populates="members")
+    workspace: Mapped["Workspace"] = relationship(back_populates="members")
     # user = relationship("User", back_populates="workspace_memberships")
 
     def __repr__(self) -> str:
@@ -158,10 +183,37 @@ class WorkspaceMember(Base):
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "id": str(self.id),
-            "workspace_id": str(self.workspace_id),
-            "user_id": str(self.user_id),
-            "role": self.role.value,
-            "permissions": self.permissions or {},
-            "created_at": self.created_at.isoformat(),
+            key: fmt(getter(self)) if fmt else getter(self)
+            for key, getter, fmt in _MEMBER_DICT_SPEC
         }
+
+
+def _or_empty(value: Optional[dict]) -> dict:
+    """Replace a missing JSON value with an empty dict."""
+    return value or {}
+
+
+# (key, getter, formatter) triples used by Workspace.to_dict
+_WORKSPACE_DICT_SPEC = (
+    ("id", attrgetter("id"), str),
+    ("name", attrgetter("name"), None),
+    ("slug", attrgetter("slug"), None),
+    ("owner_id", attrgetter("owner_id"), str),
+    ("plan", attrgetter("plan.value"), None),
+    ("sso_enabled", attrgetter("sso_enabled"), None),
+    ("sso_enforced", attrgetter("sso_enforced"), None),
+    ("settings", attrgetter("settings"), _or_empty),
+    ("metadata", attrgetter("extra_metadata"), _or_empty),
+    ("created_at", attrgetter("created_at"), datetime.isoformat),
+    ("updated_at", attrgetter("updated_at"), datetime.isoformat),
+)
+
+# (key, getter, formatter) triples used by WorkspaceMember.to_dict
+_MEMBER_DICT_SPEC = (
+    ("id", attrgetter("id"), str),
+    ("workspace_id", attrgetter("workspace_id"), str),
+    ("user_id", attrgetter("user_id"), str),
+    ("role", attrgetter("role.value"), None),
+    ("permissions", attrgetter("permissions"), _or_empty),
+    ("created_at", attrgetter("created_at"), datetime.isoformat),
+)
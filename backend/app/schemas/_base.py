@@ -0,0 +1,18 @@
+"""Shared Pydantic base schemas."""
+from pydantic import BaseModel, ConfigDict
+
+
+class FastModel(BaseModel):
+    """
+    Base schema for request bodies.
+
+    Keeps pydantic's defaults: no assignment validation or whitespace
+    stripping, and unknown fields are ignored so existing clients that send
+    extra keys keep working.
+    """
+
+
+class FastResponseModel(BaseModel):
+    """Base schema for responses built from ORM objects."""
+
+    model_config = ConfigDict(from_attributes=True)
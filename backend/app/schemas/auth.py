@@ -1,23 +1,26 @@
 """Authentication Pydantic schemas."""
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from uuid import UUID
+import msgspec
+from pydantic import EmailStr, Field
+from app.schemas._base import FastModel, FastResponseModel
 from app.schemas.user import UserResponse
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(FastModel):
     """Login request schema."""
     email: EmailStr
     password: str
 
 
-class RegisterRequest(BaseModel):
+class RegisterRequest(FastModel):
     """Register request schema."""
     email: EmailStr
     password: str = Field(..., min_length=8, max_length=100)
     name: str = Field(..., min_length=1, max_length=255)
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(FastResponseModel):
     """Token response schema."""
     access_token: str
     refresh_token: str
@@ -29,36 +32,41 @@ class AuthResponse(TokenResponse):
     user: UserResponse
 
 
-class RefreshTokenRequest(BaseModel):
+class RefreshTokenRequest(FastModel):
     """Refresh token request schema."""
     refresh_token: str
 
 
-class VerifyEmailRequest(BaseModel):
+class VerifyEmailRequest(FastModel):
     """Verify email request schema."""
     token: str
 
 
-class ForgotPasswordRequest(BaseModel):
+class ForgotPasswordRequest(FastModel):
     """Forgot password request schema."""
     email: EmailStr
 
 
-class ResetPasswordRequest(BaseModel):
+class ResetPasswordRequest(FastModel):
     """Reset password request schema."""
     token: str
     new_password: str = Field(..., min_length=8, max_length=100)
 
 
-class ChangePasswordRequest(BaseModel):
+class ChangePasswordRequest(FastModel):
     """Change password request schema."""
     current_password: str
     new_password: str = Field(..., min_length=8, max_length=100)
 
 
-class TokenPayload(BaseModel):
-    """JWT token payload schema."""
-    sub: str  # User ID
+class TokenPayload(msgspec.Struct, frozen=True):
+    """
+    JWT token payload.
+
+    Decoded on every authenticated request, so this is a msgspec struct
+    rather than a Pydantic model.
+    """
+    sub: UUID  # User ID
     email: str
     role: str
     exp: int
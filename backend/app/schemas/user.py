@@ -1,11 +1,12 @@
 """User Pydantic schemas."""
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field
 from uuid import UUID
+from app.schemas._base import FastModel
 
 
-class UserBase(BaseModel):
+class UserBase(FastModel):
     """Base user schema."""
     email: EmailStr
     name: str = Field(..., min_length=1, max_length=255)
@@ -16,7 +17,7 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=8, max_length=100)
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(FastModel):
     """Schema for updating a user."""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     avatar_url: Optional[str] = None
@@ -34,7 +35,7 @@ class UserResponse(UserBase):
     updated_at: datetime
     last_login_at: Optional[datetime] = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserInDB(UserResponse):
@@ -1,11 +1,12 @@
 """Workspace Pydantic schemas."""
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field, field_validator
 from uuid import UUID
+from app.schemas._base import FastModel, FastResponseModel
 
 
-class WorkspaceBase(BaseModel):
+class WorkspaceBase(FastModel):
     """Base workspace schema."""
     name: str = Field(..., min_length=1, max_length=255)
     slug: Optional[str] = Field(None, min_length=1, max_length=255)
@@ -16,7 +17,7 @@ class WorkspaceCreate(WorkspaceBase):
     pass
 
 
-class WorkspaceUpdate(BaseModel):
+class WorkspaceUpdate(FastModel):
     """Schema for updating a workspace."""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     settings: Optional[Dict[str, Any]] = None
@@ -32,34 +33,68 @@ class WorkspaceResponse(WorkspaceBase):
     sso_enabled: bool
     sso_enforced: bool
     settings: Dict[str, Any]
-    metadata: Dict[str, Any]
+    extra_metadata: Dict[str, Any] = Field(alias="metadata", serialization_alias="metadata")
     created_at: datetime
     updated_at: datetime
     members: list['WorkspaceMemberResponse'] = []
     user_role: Optional[str] = None  # Current user's role in this workspace
 
-    model_config = {"from_attributes": True}
-
-
-class WorkspaceMemberBase(BaseModel):
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    @classmethod
+    def from_orm_row(
+        cls,
+        workspace: Any,
+        role: Optional[Any] = None,
+        members: Optional[list['WorkspaceMemberResponse']] = None,
+    ) -> "WorkspaceResponse":
+        """
+        Build a response from a Workspace ORM object without re-validating it.
+
+        Args:
+            workspace: Workspace ORM instance (trusted database data)
+            role: Current user's WorkspaceRole, if known
+            members: Already-built member responses
+
+        Returns:
+            Workspace response
+        """
+        return cls.model_construct(
+            id=workspace.id,
+            name=workspace.name,
+            slug=workspace.slug,
+            owner_id=workspace.owner_id,
+            plan=workspace.plan.value,
+            sso_enabled=workspace.sso_enabled,
+            sso_enforced=workspace.sso_enforced,
+            settings=workspace.settings or {},
+            extra_metadata=workspace.extra_metadata or {},
+            created_at=workspace.created_at,
+            updated_at=workspace.updated_at,
+            members=members or [],
+            user_role=role.value if role else None,
+        )
+
+
+class WorkspaceMemberBase(FastModel):
     """Base workspace member schema."""
     role: str
 
 
-class WorkspaceMemberCreate(BaseModel):
+class WorkspaceMemberCreate(FastModel):
     """Schema for adding a member to workspace."""
     user_id: Optional[UUID] = None
     email: Optional[str] = None  # For inviting new users
     role: str = "member"
 
 
-class WorkspaceMemberUpdate(BaseModel):
+class WorkspaceMemberUpdate(FastModel):
     """Schema for updating a workspace member."""
     role: Optional[str] = None
     permissions: Optional[Dict[str, Any]] = None
 
 
-class WorkspaceMemberResponse(BaseModel):
+class WorkspaceMemberResponse(FastResponseModel):
     """Schema for workspace member response."""
     id: UUID
     workspace_id: UUID
@@ -69,10 +104,20 @@ class WorkspaceMemberResponse(BaseModel):
     created_at: datetime
     user: Optional[Any] = None  # Will be populated with UserResponse
 
-    model_config = {"from_attributes": True}
+    @field_validator("role", mode="before")
+    @classmethod
+    def role_value(cls, v: Any) -> Any:
+        """Accept WorkspaceRole enum members as their string value."""
+        return getattr(v, "value", v)
+
+    @field_validator("permissions", mode="before")
+    @classmethod
+    def default_permissions(cls, v: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Treat NULL permissions as an empty mapping."""
+        return v or {}
 
 
-class WorkspaceInvite(BaseModel):
+class WorkspaceInvite(FastModel):
     """Schema for workspace invitation."""
     email: str
     role: str = "member"
@@ -81,3 +126,7 @@ class WorkspaceInvite(BaseModel):
 class WorkspaceWithMembersResponse(WorkspaceResponse):
     """Schema for workspace with members."""
     members: list[WorkspaceMemberResponse] = []
+
+
+# Resolve the forward reference to WorkspaceMemberResponse
+WorkspaceResponse.model_rebuild()
@@ -1,10 +1,12 @@
 """Authentication service."""
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 from uuid import UUID
+import asyncio
+import hashlib
 import secrets
 
-from sqlalchemy import select
+from redis.asyncio import Redis
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from loguru import logger
@@ -12,13 +14,43 @@ from loguru import logger
 from app.models.user import User, UserRole
 from app.schemas.auth import RegisterRequest, LoginRequest
 from app.utils.security import (
-    hash_password,
-    verify_password,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
     decode_token,
 )
+from app.celery_app import celery_app
 from app.redis import get_redis
+from app.services.user_cache import (
+    get_user_by_email,
+    get_user_by_id,
+    invalidate_user,
+    user_cache_keys,
+)
+from app.utils.helpers import utcnow
+from app.utils.security_pool import ahash, averify
+
+
+# Refresh tokens live for 7 days (same as refresh token expiration)
+REFRESH_TOKEN_TTL = 7 * 24 * 3600
+
+# last_login_at is written at most once per user in this window
+LAST_LOGIN_INTERVAL = 300  # seconds
+
+
+def _refresh_token_hash(refresh_token: str) -> str:
+    """Short digest of a refresh token, used in Redis keys instead of the token itself."""
+    return hashlib.blake2b(refresh_token.encode(), digest_size=16).hexdigest()
+
+
+def refresh_token_key(user_id: Union[str, UUID], token_hash: str) -> str:
+    """Redis key marking a refresh token (by digest) as valid."""
+    return f"refresh_token:{user_id}:{token_hash}"
+
+
+def user_refresh_key(user_id: Union[str, UUID]) -> str:
+    """Redis set of a user's refresh token digests."""
+    return f"user_refresh:{user_id}"
 
 
 class AuthService:
@@ -27,6 +59,13 @@ class AuthService:
     def __init__(self, db: AsyncSession):
         """Initialize auth service."""
         self.db = db
+        self._redis: Optional[Redis] = None
+
+    async def _get_redis(self) -> Redis:
+        """Resolve the Redis client once per service instance."""
+        if self._redis is None:
+            self._redis = await get_redis()
+        return self._redis
 
     async def register_user(self, data: RegisterRequest) -> User:
         """
@@ -42,7 +81,7 @@ class AuthService:
             HTTPException: If email already exists
         """
         # Check if email exists
-        query = select(User).where(User.email == data.email)
+        query = select(User).where(func.lower(User.email) == data.email.lower())
         result = await self.db.execute(query)
         existing_user = result.scalar_one_or_none()
 
@@ -55,7 +94,7 @@ class AuthService:
         # Create user
         user = User(
             email=data.email,
-            password_hash=hash_password(data.password),
+            password_hash=await ahash(data.password),
             name=data.name,
             role=UserRole.USER,
             is_active=True,
@@ -63,7 +102,6 @@ class AuthService:
 
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
 
         logger.info(f"User registered: {user.email}")
 
@@ -88,7 +126,7 @@ class AuthService:
             HTTPException: If authentication fails
         """
         # Get user by email
-        query = select(User).where(User.email == data.email)
+        query = select(User).where(func.lower(User.email) == data.email.lower())
         result = await self.db.execute(query)
         user = result.scalar_one_or_none()
 
@@ -99,7 +137,7 @@ class AuthService:
             )
 
         # Verify password
-        if not user.password_hash or not verify_password(data.password, user.password_hash):
+        if not user.password_hash or not await averify(data.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -112,22 +150,27 @@ class AuthService:
                 detail="User account is inactive"
             )
 
-        # Update last login
-        user.last_login_at = datetime.utcnow()
-        await self.db.commit()
-
-        # Generate tokens
-        token_data = {
-            "sub": str(user.id),
-            "email": user.email,
-            "role": user.role.value,
-        }
+        # Upgrade hashes created with older parameters while we have the password
+        rehashed = password_needs_rehash(user.password_hash)
+        if rehashed:
+            user.password_hash = await ahash(data.password)
+            await self.db.commit()
 
-        access_token = create_access_token(token_data)
-        refresh_token = create_refresh_token(token_data)
+        # Record the login in the background, at most once per interval
+        await self._touch_last_login(user.id)
 
-        # Store refresh token in Redis (for revocation)
-        await self._store_refresh_token(str(user.id), refresh_token)
+        # Generate tokens
+        now = utcnow()
+        access_token = create_access_token(user.token_claims, now=now)
+        refresh_token = create_refresh_token(user.token_claims, now=now)
+
+        # Store refresh token in Redis (for revocation), dropping the cached
+        # user in the same round-trip if its hash was upgraded
+        await self._store_refresh_token(
+            str(user.id),
+            refresh_token,
+            *(user_cache_keys(user) if rehashed else ()),
+        )
 
         logger.info(f"User authenticated: {user.email}")
 
@@ -154,12 +197,7 @@ class AuthService:
                 detail="Invalid refresh token"
             )
 
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload"
-            )
+        user_id = payload.sub
 
         # Check if refresh token is valid in Redis
         is_valid = await self._check_refresh_token(user_id, refresh_token)
@@ -169,10 +207,8 @@ class AuthService:
                 detail="Refresh token has been revoked"
             )
 
-        # Get user from database
-        query = select(User).where(User.id == UUID(user_id))
-        result = await self.db.execute(query)
-        user = result.scalar_one_or_none()
+        # Get user (cached in Redis)
+        user = await get_user_by_id(self.db, user_id)
 
         if not user or not user.is_active:
             raise HTTPException(
@@ -181,14 +217,10 @@ class AuthService:
             )
 
         # Generate new tokens
-        token_data = {
-            "sub": str(user.id),
-            "email": user.email,
-            "role": user.role.value,
-        }
-
-        new_access_token = create_access_token(token_data)
-        new_refresh_token = create_refresh_token(token_data)
+        claims = user.token_claims
+        now = utcnow()
+        new_access_token = create_access_token(claims, now=now)
+        new_refresh_token = create_refresh_token(claims, now=now)
 
         # Revoke old refresh token and store new one
         await self._revoke_refresh_token(user_id, refresh_token)
@@ -223,7 +255,7 @@ class AuthService:
             HTTPException: If token is invalid
         """
         # Decode verification token from Redis
-        redis = await get_redis()
+        redis = await self._get_redis()
         user_id = await redis.get(f"email_verification:{token}")
 
         if not user_id:
@@ -232,8 +264,13 @@ class AuthService:
                 detail="Invalid or expired verification token"
             )
 
-        # Get user
-        query = select(User).where(User.id == UUID(user_id))
+        # Mark verified and load the user in a single UPDATE ... RETURNING
+        query = (
+            update(User)
+            .where(User.id == UUID(user_id))
+            .values(email_verified_at=utcnow())
+            .returning(User)
+        )
         result = await self.db.execute(query)
         user = result.scalar_one_or_none()
 
@@ -243,9 +280,8 @@ class AuthService:
                 detail="User not found"
             )
 
-        # Update user
-        user.email_verified_at = datetime.utcnow()
         await self.db.commit()
+        await invalidate_user(user)
 
         # Delete verification token
         await redis.delete(f"email_verification:{token}")
@@ -267,10 +303,8 @@ class AuthService:
         Raises:
             HTTPException: If user not found
         """
-        # Get user
-        query = select(User).where(User.email == email)
-        result = await self.db.execute(query)
-        user = result.scalar_one_or_none()
+        # Get user (cached in Redis)
+        user = await get_user_by_email(self.db, email)
 
         if not user:
             # Don't reveal that user doesn't exist (security)
@@ -281,7 +315,7 @@ class AuthService:
         reset_token = secrets.token_urlsafe(32)
 
         # Store in Redis with 1 hour expiration
-        redis = await get_redis()
+        redis = await self._get_redis()
         await redis.setex(
             f"password_reset:{reset_token}",
             3600,  # 1 hour
@@ -311,7 +345,7 @@ class AuthService:
             HTTPException: If token is invalid
         """
         # Get user ID from Redis
-        redis = await get_redis()
+        redis = await self._get_redis()
         user_id = await redis.get(f"password_reset:{token}")
 
         if not user_id:
@@ -320,8 +354,13 @@ class AuthService:
                 detail="Invalid or expired reset token"
             )
 
-        # Get user
-        query = select(User).where(User.id == UUID(user_id))
+        # Update password and load the user in a single UPDATE ... RETURNING
+        query = (
+            update(User)
+            .where(User.id == UUID(user_id))
+            .values(password_hash=await ahash(new_password))
+            .returning(User)
+        )
         result = await self.db.execute(query)
         user = result.scalar_one_or_none()
 
@@ -331,15 +370,15 @@ class AuthService:
                 detail="User not found"
             )
 
-        # Update password
-        user.password_hash = hash_password(new_password)
         await self.db.commit()
 
-        # Delete reset token
-        await redis.delete(f"password_reset:{token}")
-
-        # Revoke all refresh tokens for security
-        await self._revoke_all_refresh_tokens(str(user.id))
+        # Revoke all refresh tokens for security, deleting the reset token and
+        # the cached user in the same round-trip
+        await self._revoke_all_refresh_tokens(
+            str(user.id),
+            f"password_reset:{token}",
+            *user_cache_keys(user),
+        )
 
         logger.info(f"Password reset for user: {user.email}")
 
@@ -377,60 +416,91 @@ class AuthService:
             )
 
         # Verify current password
-        if not user.password_hash or not verify_password(current_password, user.password_hash):
+        if not user.password_hash or not await averify(current_password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Current password is incorrect"
             )
 
         # Update password
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await ahash(new_password)
         await self.db.commit()
+        await invalidate_user(user)
 
         logger.info(f"Password changed for user: {user.email}")
 
         return user
 
+    async def _touch_last_login(self, user_id: UUID) -> None:
+        """Queue a last_login_at update unless one was queued recently."""
+        redis = await self._get_redis()
+        if await redis.set(f"last_login:{user_id}", "1", ex=LAST_LOGIN_INTERVAL, nx=True):
+            # Publishing is a blocking broker round-trip; keep it off the event loop
+            await asyncio.to_thread(
+                celery_app.send_task,
+                "app.tasks.user.touch_last_login",
+                args=[str(user_id), utcnow().isoformat()],
+            )
+
     # Private helper methods for refresh token management
 
-    async def _store_refresh_token(self, user_id: str, refresh_token: str) -> None:
-        """Store refresh token in Redis."""
-        redis = await get_redis()
-        # Store for 7 days (same as refresh token expiration)
-        await redis.setex(
-            f"refresh_token:{user_id}:{refresh_token}",
-            7 * 24 * 3600,
-            "1"
-        )
+    async def _store_refresh_token(
+        self,
+        user_id: Union[str, UUID],
+        refresh_token: str,
+        *stale_keys: str
+    ) -> None:
+        """
+        Store refresh token in Redis and track it in the user's token set.
 
-    async def _check_refresh_token(self, user_id: str, refresh_token: str) -> bool:
+        Any ``stale_keys`` are deleted in the same pipeline.
+        """
+        redis = await self._get_redis()
+        token_hash = _refresh_token_hash(refresh_token)
+        user_key = user_refresh_key(user_id)
+        async with redis.pipeline(transaction=False) as pipe:
+            if stale_keys:
+                pipe.delete(*stale_keys)
+            pipe.sadd(user_key, token_hash)
+            pipe.setex(refresh_token_key(user_id, token_hash), REFRESH_TOKEN_TTL, "1")
+            pipe.expire(user_key, REFRESH_TOKEN_TTL)
+            await pipe.execute()
+
+    async def _check_refresh_token(self, user_id: Union[str, UUID], refresh_token: str) -> bool:
         """Check if refresh token is valid."""
-        redis = await get_redis()
-        exists = await redis.exists(f"refresh_token:{user_id}:{refresh_token}")
+        redis = await self._get_redis()
+        token_hash = _refresh_token_hash(refresh_token)
+        exists = await redis.exists(refresh_token_key(user_id, token_hash))
         return bool(exists)
 
-    async def _revoke_refresh_token(self, user_id: str, refresh_token: str) -> None:
+    async def _revoke_refresh_token(self, user_id: Union[str, UUID], refresh_token: str) -> None:
         """Revoke a specific refresh token."""
-        redis = await get_redis()
-        await redis.delete(f"refresh_token:{user_id}:{refresh_token}")
-
-    async def _revoke_all_refresh_tokens(self, user_id: str) -> None:
-        """Revoke all refresh tokens for a user."""
-        redis = await get_redis()
-        # Find all keys for this user
-        pattern = f"refresh_token:{user_id}:*"
-        cursor = 0
-        while True:
-            cursor, keys = await redis.scan(cursor, match=pattern, count=100)
-            if keys:
-                await redis.delete(*keys)
-            if cursor == 0:
-                break
+        redis = await self._get_redis()
+        token_hash = _refresh_token_hash(refresh_token)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.delete(refresh_token_key(user_id, token_hash))
+            pipe.srem(user_refresh_key(user_id), token_hash)
+            await pipe.execute()
+
+    async def _revoke_all_refresh_tokens(self, user_id: Union[str, UUID], *stale_keys: str) -> None:
+        """
+        Revoke all refresh tokens for a user.
+
+        Any ``stale_keys`` are deleted together with the tokens.
+        """
+        redis = await self._get_redis()
+        user_key = user_refresh_key(user_id)
+        token_hashes = await redis.smembers(user_key)
+        await redis.delete(
+            user_key,
+            *(refresh_token_key(user_id, token_hash) for token_hash in token_hashes),
+            *stale_keys,
+        )
 
     async def create_verification_token(self, user_id: UUID) -> str:
         """Create email verification token."""
         token = secrets.token_urlsafe(32)
-        redis = await get_redis()
+        redis = await self._get_redis()
         # Store for 24 hours
         await redis.setex(f"email_verification:{token}", 86400, str(user_id))
         return token
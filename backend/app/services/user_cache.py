@@ -0,0 +1,139 @@
+"""Redis read-through cache for user lookups in auth flows."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+import msgspec
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User, UserRole
+from app.redis import get_redis
+
+USER_CACHE_TTL = 60  # seconds
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    """
+    Scalar user columns needed by auth flows that do not modify the user.
+
+    Credential material such as the password hash is never cached.
+    """
+
+    id: UUID
+    email: str
+    role: UserRole
+    is_active: bool
+    email_verified_at: Optional[datetime]
+
+    @property
+    def token_claims(self) -> Dict[str, Any]:
+        """Identity claims for JWTs, matching User.token_claims."""
+        return {
+            "sub": str(self.id),
+            "email": self.email,
+            "role": self.role.value,
+        }
+
+
+def _email_key(email: str) -> str:
+    return f"user:email:{email.lower()}"
+
+
+def _id_key(user_id: UUID) -> str:
+    return f"user:id:{user_id}"
+
+
+# JSON rather than msgpack: the shared Redis client decodes responses to str.
+# Typed decoding builds CachedUser directly, without an intermediate dict.
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(CachedUser)
+
+
+async def _load(
+    db: AsyncSession,
+    key: str,
+    condition: ColumnElement[bool],
+) -> Optional[CachedUser]:
+    redis = await get_redis()
+    raw = await redis.get(key)
+    if raw is not None:
+        try:
+            return _decoder.decode(raw)
+        except msgspec.DecodeError:
+            pass  # Entry written in an older format; reload it
+
+    result = await db.execute(select(User).where(condition))
+    user = result.scalar_one_or_none()
+    if user is None:
+        return None
+
+    cached = CachedUser(
+        id=user.id,
+        email=user.email,
+        role=user.role,
+        is_active=user.is_active,
+        email_verified_at=user.email_verified_at,
+    )
+    packed = _encoder.encode(cached)
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.setex(_email_key(user.email), USER_CACHE_TTL, packed)
+        pipe.setex(_id_key(user.id), USER_CACHE_TTL, packed)
+        await pipe.execute()
+    return cached
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[CachedUser]:
+    """
+    Get a user by email, served from Redis when cached.
+
+    Args:
+        db: Database session
+        email: User email (case-insensitive)
+
+    Returns:
+        Cached user or None if no user has this email
+    """
+    return await _load(db, _email_key(email), func.lower(User.email) == email.lower())
+
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[CachedUser]:
+    """
+    Get a user by ID, served from Redis when cached.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        Cached user or None if the user does not exist
+    """
+    return await _load(db, _id_key(user_id), User.id == user_id)
+
+
+def user_cache_keys(user: Union[User, CachedUser]) -> Tuple[str, str]:
+    """
+    Get the Redis keys a user is cached under.
+
+    Lets callers drop the entries as part of their own pipeline.
+
+    Args:
+        user: User
+
+    Returns:
+        Tuple of (email key, ID key)
+    """
+    return _email_key(user.email), _id_key(user.id)
+
+
+async def invalidate_user(user: User) -> None:
+    """
+    Drop a user's cached entries after it has been modified.
+
+    Args:
+        user: Modified user
+    """
+    redis = await get_redis()
+    await redis.delete(*user_cache_keys(user))
@@ -1,15 +1,34 @@
 """Workspace service."""
-import re
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, and_, or_
+from sqlalchemy import Row, delete, exists, insert, literal, select, and_, or_, lambda_stmt, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from loguru import logger
 
 from app.models.user import User
-from app.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+from app.models.workspace import Workspace, WorkspaceMember, WorkspacePlan, WorkspaceRole
+from app.redis import get_redis
 from app.schemas.workspace import WorkspaceCreate, WorkspaceUpdate, WorkspaceMemberCreate
+from app.utils.helpers import slugify, to_naive_utc, uuid7
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+MEMBER_ROLE_CACHE_TTL = 30  # seconds
+
+
+def _member_role_key(workspace_id: UUID, user_id: UUID) -> str:
+    """Redis key caching a user's role in a workspace ("" for non-members)."""
+    return f"workspace_role:{workspace_id}:{user_id}"
+
+
+def _cursor(after: Tuple[datetime, UUID]) -> Tuple[datetime, UUID]:
+    """Normalize a (created_at, id) keyset cursor for naive UTC timestamp columns."""
+    created_at, row_id = after
+    return to_naive_utc(created_at), row_id
 
 
 class WorkspaceService:
@@ -19,22 +38,6 @@ class WorkspaceService:
         """Initialize workspace service."""
         self.db = db
 
-    def _slugify(self, text: str) -> str:
-        """
-        Convert text to slug format.
-
-        Args:
-            text: Text to slugify
-
-        Returns:
-            Slugified text
-        """
-        text = text.lower()
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[\s_-]+', '-', text)
-        text = re.sub(r'^-+|-+$', '', text)
-        return text
-
     async def create_workspace(self, data: WorkspaceCreate, owner_id: UUID) -> Workspace:
         """
         Create a new workspace.
@@ -50,48 +53,58 @@ class WorkspaceService:
             HTTPException: If slug already exists
         """
         # Generate slug from name if not provided
-        slug = data.slug if data.slug else self._slugify(data.name)
+        slug = data.slug if data.slug else slugify(data.name)
 
-        # Check if slug already exists
-        query = select(Workspace).where(Workspace.slug == slug)
+        # Fetch the slug and all of its numbered variants in one query
+        query = select(Workspace.slug).where(
+            or_(Workspace.slug == slug, Workspace.slug.startswith(f"{slug}-", autoescape=True))
+        )
         result = await self.db.execute(query)
-        existing = result.scalar_one_or_none()
+        taken = set(result.scalars())
 
-        if existing:
-            # Try adding a number suffix
+        if slug in taken:
+            # Use the first free number suffix
             counter = 1
-            while existing:
-                new_slug = f"{slug}-{counter}"
-                query = select(Workspace).where(Workspace.slug == new_slug)
-                result = await self.db.execute(query)
-                existing = result.scalar_one_or_none()
-                if not existing:
-                    slug = new_slug
-                    break
+            while f"{slug}-{counter}" in taken:
                 counter += 1
-
-        # Create workspace
-        workspace = Workspace(
-            name=data.name,
-            slug=slug,
-            owner_id=owner_id,
-            settings={},
-            metadata={}
+            slug = f"{slug}-{counter}"
+
+        # Insert the workspace and its owner membership in a single statement
+        new_workspace = (
+            insert(Workspace)
+            .values(
+                id=uuid7(),
+                name=data.name,
+                slug=slug,
+                owner_id=owner_id,
+                plan=WorkspacePlan.FREE,
+                sso_enabled=False,
+                sso_enforced=False,
+                settings={},
+                extra_metadata={},
+            )
+            .returning(*Workspace.__table__.c)
+            .cte("new_workspace")
         )
-
-        self.db.add(workspace)
-        await self.db.flush()
-
-        # Add owner as workspace member
-        member = WorkspaceMember(
-            workspace_id=workspace.id,
-            user_id=owner_id,
-            role=WorkspaceRole.OWNER
+        owner_member = (
+            insert(WorkspaceMember)
+            .from_select(
+                ["id", "workspace_id", "user_id", "role"],
+                select(
+                    literal(uuid7(), WorkspaceMember.id.type),
+                    new_workspace.c.id,
+                    new_workspace.c.owner_id,
+                    literal(WorkspaceRole.OWNER, WorkspaceMember.role.type),
+                ),
+            )
+            .cte("owner_member")
         )
-        self.db.add(member)
+        insert_stmt = select(Workspace).from_statement(
+            select(new_workspace).add_cte(owner_member)
+        )
+        workspace: Workspace = (await self.db.execute(insert_stmt)).scalar_one()
 
         await self.db.commit()
-        await self.db.refresh(workspace)
 
         logger.info(f"Workspace created: {workspace.name} ({workspace.slug})")
 
@@ -111,6 +124,99 @@ class WorkspaceService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_workspace_with_role(
+        self,
+        workspace_id: UUID,
+        user_id: UUID
+    ) -> Tuple[Optional[Workspace], Optional[WorkspaceRole]]:
+        """
+        Get workspace by ID together with the user's role in a single query.
+
+        Args:
+            workspace_id: Workspace UUID
+            user_id: User UUID
+
+        Returns:
+            Tuple of (workspace or None, user's role or None if not a member)
+        """
+        query = (
+            select(Workspace, WorkspaceMember.role)
+            .outerjoin(
+                WorkspaceMember,
+                and_(
+                    WorkspaceMember.workspace_id == Workspace.id,
+                    WorkspaceMember.user_id == user_id
+                )
+            )
+            .where(Workspace.id == workspace_id)
+        )
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    async def get_workspace_with_context(
+        self,
+        workspace_id: UUID,
+        user_id: UUID
+    ) -> Tuple[Optional[Workspace], Optional[WorkspaceRole]]:
+        """
+        Get workspace by ID with its members and the user's role in one round-trip.
+
+        Members are eager-loaded with a single follow-up IN query.
+
+        Args:
+            workspace_id: Workspace UUID
+            user_id: User UUID
+
+        Returns:
+            Tuple of (workspace or None, user's role or None if not a member)
+        """
+        return await self._get_workspace_with_context(Workspace.id == workspace_id, user_id)
+
+    async def get_workspace_by_slug_with_context(
+        self,
+        slug: str,
+        user_id: UUID
+    ) -> Tuple[Optional[Workspace], Optional[WorkspaceRole]]:
+        """
+        Get workspace by slug with its members and the user's role in one round-trip.
+
+        Args:
+            slug: Workspace slug
+            user_id: User UUID
+
+        Returns:
+            Tuple of (workspace or None, user's role or None if not a member)
+        """
+        return await self._get_workspace_with_context(Workspace.slug == slug, user_id)
+
+    async def _get_workspace_with_context(
+        self,
+        condition: Any,
+        user_id: UUID
+    ) -> Tuple[Optional[Workspace], Optional[WorkspaceRole]]:
+        """Load a workspace matching ``condition`` with members and the user's role."""
+        user_role = (
+            select(WorkspaceMember.role)
+            .where(
+                WorkspaceMember.workspace_id == Workspace.id,
+                WorkspaceMember.user_id == user_id
+            )
+            .scalar_subquery()
+        )
+        query = (
+            select(Workspace, user_role.label("user_role"))
+            .options(selectinload(Workspace.members))
+            .where(condition)
+        )
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
     async def get_workspace_by_slug(self, slug: str) -> Optional[Workspace]:
         """
         Get workspace by slug.
@@ -125,12 +231,21 @@ class WorkspaceService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_user_workspaces(self, user_id: UUID) -> List[Workspace]:
+    async def get_user_workspaces(
+        self,
+        user_id: UUID,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Workspace]:
         """
-        Get all workspaces for a user.
+        Get a page of workspaces for a user, newest first.
 
         Args:
             user_id: User UUID
+            limit: Maximum number of workspaces to return
+            after: Keyset cursor; only return workspaces ordered after it.
+                The (created_at, id) of the last item of the previous page.
 
         Returns:
             List of workspaces
@@ -139,11 +254,51 @@ class WorkspaceService:
             select(Workspace)
             .join(WorkspaceMember)
             .where(WorkspaceMember.user_id == user_id)
-            .order_by(Workspace.created_at.desc())
+            .order_by(Workspace.created_at.desc(), Workspace.id.desc())
+            .limit(limit)
         )
+        if after is not None:
+            query = query.where(
+                tuple_(Workspace.created_at, Workspace.id) < _cursor(after)
+            )
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_user_workspaces_with_roles(
+        self,
+        user_id: UUID,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Tuple[Workspace, WorkspaceRole]]:
+        """
+        Get a page of workspaces for a user together with the user's role in each.
+
+        Workspaces are ordered newest first.
+
+        Args:
+            user_id: User UUID
+            limit: Maximum number of workspaces to return
+            after: Keyset cursor; only return workspaces ordered after it.
+                The (created_at, id) of the last item of the previous page.
+
+        Returns:
+            List of (workspace, role) tuples
+        """
+        query = (
+            select(Workspace, WorkspaceMember.role)
+            .join(WorkspaceMember, WorkspaceMember.workspace_id == Workspace.id)
+            .where(WorkspaceMember.user_id == user_id)
+            .order_by(Workspace.created_at.desc(), Workspace.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(Workspace.created_at, Workspace.id) < _cursor(after)
+            )
+        result = await self.db.execute(query)
+        return [(workspace, role) for workspace, role in result.all()]
+
     async def update_workspace(
         self,
         workspace_id: UUID,
@@ -164,8 +319,8 @@ class WorkspaceService:
         Raises:
             HTTPException: If workspace not found or user lacks permission
         """
-        # Get workspace
-        workspace = await self.get_workspace(workspace_id)
+        # Get workspace and the user's role in it
+        workspace, role = await self.get_workspace_with_role(workspace_id, user_id)
         if not workspace:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -173,12 +328,7 @@ class WorkspaceService:
             )
 
         # Check if user has permission (owner or admin)
-        has_permission = await self.check_workspace_permission(
-            workspace_id,
-            user_id,
-            [WorkspaceRole.OWNER, WorkspaceRole.ADMIN]
-        )
-        if not has_permission:
+        if role not in (WorkspaceRole.OWNER, WorkspaceRole.ADMIN):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions"
@@ -195,7 +345,6 @@ class WorkspaceService:
             workspace.sso_enforced = data.sso_enforced
 
         await self.db.commit()
-        await self.db.refresh(workspace)
 
         logger.info(f"Workspace updated: {workspace.id}")
 
@@ -226,8 +375,17 @@ class WorkspaceService:
                 detail="Only workspace owner can delete the workspace"
             )
 
+        # Members go with the workspace; collect them to drop their cached roles
+        result = await self.db.execute(
+            delete(WorkspaceMember)
+            .where(WorkspaceMember.workspace_id == workspace_id)
+            .returning(WorkspaceMember.user_id)
+        )
+        member_ids = result.scalars().all()
+
         await self.db.delete(workspace)
         await self.db.commit()
+        await self._invalidate_member_roles(workspace_id, *member_ids)
 
         logger.info(f"Workspace deleted: {workspace_id}")
 
@@ -251,54 +409,54 @@ class WorkspaceService:
         Raises:
             HTTPException: If workspace not found, user not found, or insufficient permissions
         """
+        # Resolve every precondition in one round-trip; a session cannot run
+        # statements concurrently, so the lookups are fused into scalar subqueries
+        query = select(
+            exists().where(Workspace.id == workspace_id),
+            select(WorkspaceMember.role)
+            .where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id == inviter_id
+            )
+            .scalar_subquery(),
+            exists().where(User.id == data.user_id),
+            exists().where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id == data.user_id
+            ),
+        )
+        result = await self.db.execute(query)
+        workspace_exists, inviter_role, user_exists, already_member = result.one()
+
         # Check workspace exists
-        workspace = await self.get_workspace(workspace_id)
-        if not workspace:
+        if not workspace_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Workspace not found"
             )
 
         # Check inviter has permission
-        has_permission = await self.check_workspace_permission(
-            workspace_id,
-            inviter_id,
-            [WorkspaceRole.OWNER, WorkspaceRole.ADMIN]
-        )
-        if not has_permission:
+        if inviter_role not in (WorkspaceRole.OWNER, WorkspaceRole.ADMIN):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions to add members"
             )
 
-        # Get user to add
+        # Check user to add
         if not data.user_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="user_id is required"
             )
 
-        user_query = select(User).where(User.id == data.user_id)
-        user_result = await self.db.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
+        if not user_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
 
         # Check if already a member
-        existing_query = select(WorkspaceMember).where(
-            and_(
-                WorkspaceMember.workspace_id == workspace_id,
-                WorkspaceMember.user_id == data.user_id
-            )
-        )
-        existing_result = await self.db.execute(existing_query)
-        existing = existing_result.scalar_one_or_none()
-
-        if existing:
+        if already_member:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User is already a member"
@@ -313,7 +471,7 @@ class WorkspaceService:
 
         self.db.add(member)
         await self.db.commit()
-        await self.db.refresh(member)
+        await self._invalidate_member_roles(workspace_id, data.user_id)
 
         logger.info(f"Member added to workspace {workspace_id}: {data.user_id}")
 
@@ -336,15 +494,25 @@ class WorkspaceService:
         Raises:
             HTTPException: If member not found or insufficient permissions
         """
-        # Get member
-        query = select(WorkspaceMember).where(
+        # Get member together with the remover's role
+        remover_role = (
+            select(WorkspaceMember.role)
+            .where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id == remover_id
+            )
+            .correlate(None)
+            .scalar_subquery()
+        )
+        query = select(WorkspaceMember, remover_role).where(
             and_(
                 WorkspaceMember.workspace_id == workspace_id,
                 WorkspaceMember.id == member_id
             )
         )
         result = await self.db.execute(query)
-        member = result.scalar_one_or_none()
+        row = result.one_or_none()
+        member, role = row if row is not None else (None, None)
 
         if not member:
             raise HTTPException(
@@ -360,12 +528,7 @@ class WorkspaceService:
             )
 
         # Check permission
-        has_permission = await self.check_workspace_permission(
-            workspace_id,
-            remover_id,
-            [WorkspaceRole.OWNER, WorkspaceRole.ADMIN]
-        )
-        if not has_permission:
+        if role not in (WorkspaceRole.OWNER, WorkspaceRole.ADMIN):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions"
@@ -373,26 +536,53 @@ class WorkspaceService:
 
         await self.db.delete(member)
         await self.db.commit()
+        await self._invalidate_member_roles(workspace_id, member.user_id)
 
         logger.info(f"Member removed from workspace {workspace_id}: {member.user_id}")
 
-    async def get_workspace_members(self, workspace_id: UUID) -> List[WorkspaceMember]:
+    async def get_workspace_members(
+        self,
+        workspace_id: UUID,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Row]:
         """
-        Get all members of a workspace.
+        Get a page of members of a workspace, oldest first.
+
+        Only the member columns are selected, so rows are returned without
+        hydrating ORM instances; the (workspace_id, created_at, id) index serves
+        the query.
 
         Args:
             workspace_id: Workspace UUID
+            limit: Maximum number of members to return
+            after: Keyset cursor; only return members ordered after it.
+                The (created_at, id) of the last item of the previous page.
 
         Returns:
-            List of workspace members
+            List of member rows with id, workspace_id, user_id, role,
+            permissions and created_at
         """
         query = (
-            select(WorkspaceMember)
+            select(
+                WorkspaceMember.id,
+                WorkspaceMember.workspace_id,
+                WorkspaceMember.user_id,
+                WorkspaceMember.role,
+                WorkspaceMember.permissions,
+                WorkspaceMember.created_at,
+            )
             .where(WorkspaceMember.workspace_id == workspace_id)
-            .order_by(WorkspaceMember.created_at)
+            .order_by(WorkspaceMember.created_at, WorkspaceMember.id)
+            .limit(limit)
         )
+        if after is not None:
+            query = query.where(
+                tuple_(WorkspaceMember.created_at, WorkspaceMember.id) > _cursor(after)
+            )
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def check_workspace_permission(
         self,
@@ -411,19 +601,12 @@ class WorkspaceService:
         Returns:
             True if user has permission, False otherwise
         """
-        query = select(WorkspaceMember).where(
-            and_(
-                WorkspaceMember.workspace_id == workspace_id,
-                WorkspaceMember.user_id == user_id
-            )
-        )
-        result = await self.db.execute(query)
-        member = result.scalar_one_or_none()
+        role = await self._get_member_role(workspace_id, user_id)
 
-        if not member:
+        if role is None:
             return False
 
-        if required_roles and member.role not in required_roles:
+        if required_roles and role not in required_roles:
             return False
 
         return True
@@ -443,13 +626,40 @@ class WorkspaceService:
         Returns:
             WorkspaceRole or None
         """
-        query = select(WorkspaceMember).where(
-            and_(
+        return await self._get_member_role(workspace_id, user_id)
+
+    async def _get_member_role(
+        self,
+        workspace_id: UUID,
+        user_id: UUID
+    ) -> Optional[WorkspaceRole]:
+        """
+        Fetch a membership role, served from Redis when cached.
+
+        Non-members are cached too. On a miss the lambda statement is compiled
+        once and reused.
+        """
+        redis = await get_redis()
+        key = _member_role_key(workspace_id, user_id)
+        cached = await redis.get(key)
+        if cached is not None:
+            return WorkspaceRole(cached) if cached else None
+
+        query = lambda_stmt(
+            lambda: select(WorkspaceMember.role).where(
                 WorkspaceMember.workspace_id == workspace_id,
                 WorkspaceMember.user_id == user_id
             )
         )
         result = await self.db.execute(query)
-        member = result.scalar_one_or_none()
+        role = result.scalar_one_or_none()
+
+        await redis.setex(key, MEMBER_ROLE_CACHE_TTL, role.value if role else "")
+        return role
 
-        return member.role if member else None
+    async def _invalidate_member_roles(self, workspace_id: UUID, *user_ids: UUID) -> None:
+        """Drop cached roles of users whose membership changed."""
+        if not user_ids:
+            return
+        redis = await get_redis()
+        await redis.delete(*(_member_role_key(workspace_id, user_id) for user_id in user_ids))
@@ -0,0 +1,61 @@
+"""Long-lived event loop for running async code from Celery tasks."""
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+from celery.signals import worker_process_init
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get this process's background event loop, starting it on first use.
+
+    The loop runs forever in a daemon thread. A forked child never reuses
+    its parent's loop.
+
+    Returns:
+        asyncio.AbstractEventLoop: Running event loop
+    """
+    global _loop, _loop_pid
+    pid = os.getpid()
+    if _loop is not None and _loop_pid == pid:
+        return _loop
+
+    with _loop_lock:
+        if _loop is None or _loop_pid != pid:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="celery-event-loop",
+                daemon=True,
+            ).start()
+            _loop, _loop_pid = loop, pid
+    return _loop
+
+
+@worker_process_init.connect
+def start_event_loop(**kwargs: Any) -> None:
+    """Start the event loop when a prefork child boots, not on its first task."""
+    _get_loop()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the process's event loop and wait for its result.
+
+    Safe to call from any worker thread, so tasks in a threads pool share
+    one loop and its database, Redis and SMTP connections.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
@@ -1,66 +1,160 @@
 """Analytics-related Celery tasks."""
-from app.celery_app import celery_app
-from loguru import logger
+import os
+from datetime import timedelta
+from uuid import UUID
 
+from sqlalchemy import func, select, text, update
+from loguru import logger
 
-@celery_app.task(name="app.tasks.analytics.process_analytics")
+from app.celery_app import celery_app
+from app.tasks._loop import run_async
+from app.database import engine
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceMember
+from app.utils.helpers import utcnow
+
+# Members who logged in within this window count as active
+ACTIVE_MEMBER_WINDOW = timedelta(days=30)
+
+REPORT_DIR = "/tmp/reports"
+
+# Report type -> COPY query over the workspace's rows in system_metrics_hourly
+REPORT_QUERIES = {
+    "hourly": (
+        "SELECT hour, metric, value FROM system_metrics_hourly "
+        "WHERE workspace_id = $1 ORDER BY hour, metric"
+    ),
+    "daily": (
+        "SELECT date_trunc('day', hour) AS day, metric, sum(value) AS value "
+        "FROM system_metrics_hourly WHERE workspace_id = $1 "
+        "GROUP BY 1, 2 ORDER BY 1, 2"
+    ),
+}
+
+
+async def _refresh_system_metrics() -> None:
+    """Recompute the hourly metrics view without blocking readers."""
+    async with engine.begin() as conn:
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY system_metrics_hourly"))
+
+
+@celery_app.task(name="app.tasks.analytics.process_analytics", ignore_result=True)
 def process_analytics() -> None:
     """
     Process analytics data.
 
-    This task aggregates raw event data into time-series metrics.
+    Aggregates raw rows into hourly metrics inside Postgres by refreshing the
+    system_metrics_hourly materialized view.
     """
     logger.info("Processing analytics data...")
 
-    # TODO: Implement analytics processing logic
-    # 1. Fetch raw events from database
-    # 2. Aggregate by time period (hourly, daily)
-    # 3. Calculate metrics (DAU, MAU, feature usage, etc.)
-    # 4. Store in system_metrics table
+    run_async(_refresh_system_metrics())
 
     logger.info("Analytics processing complete")
 
 
+async def _calculate_workspace_usage(workspace_id: UUID) -> None:
+    """Count members in SQL and store the result under extra_metadata["usage"]."""
+    members = (
+        select(func.count())
+        .select_from(WorkspaceMember)
+        .where(WorkspaceMember.workspace_id == workspace_id)
+        .scalar_subquery()
+    )
+    active_members = (
+        select(func.count())
+        .select_from(WorkspaceMember)
+        .join(User, User.id == WorkspaceMember.user_id)
+        .where(
+            WorkspaceMember.workspace_id == workspace_id,
+            User.last_login_at >= utcnow() - ACTIVE_MEMBER_WINDOW,
+        )
+        .scalar_subquery()
+    )
+    usage = func.jsonb_build_object(
+        "members", members,
+        "active_members", active_members,
+        "calculated_at", func.now(),
+    )
+    query = (
+        update(Workspace)
+        .where(Workspace.id == workspace_id)
+        .values(
+            # extra_metadata is nullable, and NULL || jsonb is NULL
+            extra_metadata=func.coalesce(Workspace.extra_metadata, text("'{}'::jsonb")).op("||")(
+                func.jsonb_build_object("usage", usage)
+            ),
+            # Background bookkeeping; don't let onupdate bump the user-visible timestamp
+            updated_at=Workspace.updated_at,
+        )
+    )
+    async with engine.begin() as conn:
+        await conn.execute(query)
+
+
 @celery_app.task(name="app.tasks.analytics.calculate_workspace_usage")
 def calculate_workspace_usage(workspace_id: str) -> None:
     """
     Calculate usage metrics for a specific workspace.
 
+    Usage covers membership only: the total member count and the number of
+    members who logged in within ACTIVE_MEMBER_WINDOW, stored with a
+    timestamp under extra_metadata["usage"].
+
     Args:
         workspace_id: UUID of the workspace
     """
-    logger.info(f"Calculating usage metrics for workspace {workspace_id}")
+    logger.info("Calculating usage metrics for workspace {}", workspace_id)
+
+    run_async(_calculate_workspace_usage(UUID(workspace_id)))
+
+    logger.info("Usage calculation complete for workspace {}", workspace_id)
 
-    # TODO: Implement workspace usage calculation
-    # 1. Count active users
-    # 2. Count API calls
-    # 3. Calculate storage usage
-    # 4. Update workspace usage metrics
 
-    logger.info(f"Usage calculation complete for workspace {workspace_id}")
+async def _export_workspace_metrics(query: str, workspace_id: UUID, report_path: str) -> None:
+    """Stream a workspace's metrics to a CSV file with COPY."""
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        # Always set for a live asyncpg connection; narrows the Optional for mypy
+        assert raw.driver_connection is not None
+        await raw.driver_connection.copy_from_query(
+            query,
+            workspace_id,
+            output=report_path,
+            format="csv",
+            header=True,
+        )
 
 
-@celery_app.task(name="app.tasks.analytics.generate_report")
+@celery_app.task(name="app.tasks.analytics.generate_report", ignore_result=False)
 def generate_report(workspace_id: str, report_type: str) -> str:
     """
     Generate analytics report.
 
     Args:
         workspace_id: UUID of the workspace
-        report_type: Type of report to generate
+        report_type: Type of report to generate, a key of REPORT_QUERIES
 
     Returns:
         str: Path to generated report file
+
+    Raises:
+        ValueError: If report_type or workspace_id is invalid
     """
-    logger.info(f"Generating {report_type} report for workspace {workspace_id}")
+    query = REPORT_QUERIES.get(report_type)
+    if query is None:
+        raise ValueError(f"Unknown report type: {report_type!r}")
+    workspace_uuid = UUID(workspace_id)
+
+    logger.info("Generating {} report for workspace {}", report_type, workspace_uuid)
+
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    # Built only from validated values, so the path stays inside REPORT_DIR
+    report_path = os.path.join(REPORT_DIR, f"{workspace_uuid}_{report_type}.csv")
 
-    # TODO: Implement report generation
-    # 1. Fetch analytics data
-    # 2. Generate report (CSV, PDF, etc.)
-    # 3. Store report file
-    # 4. Return file path
+    # Postgres writes the CSV; rows never become Python objects
+    run_async(_export_workspace_metrics(query, workspace_uuid, report_path))
 
-    report_path = f"/tmp/reports/{workspace_id}_{report_type}.csv"
-    logger.info(f"Report generated: {report_path}")
+    logger.info("Report generated: {}", report_path)
 
     return report_path
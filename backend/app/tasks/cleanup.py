@@ -1,31 +1,119 @@
 """Cleanup-related Celery tasks."""
 from datetime import datetime, timedelta
+from typing import List
+from sqlalchemy import Select, delete, exists, select
 from app.celery_app import celery_app
+from app.database import engine
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.redis import get_redis
+from app.services.auth import refresh_token_key, user_refresh_key
+from app.tasks._loop import run_async
+from app.utils.helpers import utcnow
 from loguru import logger
 
-
-@celery_app.task(name="app.tasks.cleanup.cleanup_expired_tokens")
+# Rows deleted per task run; each batch commits on its own so locks stay short
+CLEANUP_BATCH_SIZE = 5000
+
+UNVERIFIED_USER_MAX_AGE = timedelta(days=7)
+
+# Keys requested per SCAN call; each page of token sets is checked in one round trip
+TOKEN_SCAN_COUNT = 1000
+
+
+def _unverified_user_ids(cutoff: datetime, batch_size: int) -> Select:
+    """Select one batch of unverified password users created before ``cutoff``."""
+    return (
+        select(User.id)
+        .where(
+            User.email_verified_at.is_(None),
+            # SSO users never verify an email address with us; keep them
+            User.sso_provider.is_(None),
+            User.created_at < cutoff,
+            # Workspace ownership does not cascade; keep owners
+            ~exists().where(Workspace.owner_id == User.id),
+        )
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+
+async def _delete_unverified_users(cutoff: datetime, batch_size: int) -> int:
+    """Delete one batch of unverified users created before ``cutoff``."""
+    stale_ids = _unverified_user_ids(cutoff, batch_size)
+    async with engine.begin() as conn:
+        result = await conn.execute(delete(User).where(User.id.in_(stale_ids)))
+    return result.rowcount
+
+
+async def _prune_token_sets(set_keys: List[str]) -> int:
+    """Drop digests of expired refresh tokens from a page of user token sets."""
+    redis = await get_redis()
+    async with redis.pipeline(transaction=False) as pipe:
+        for set_key in set_keys:
+            pipe.smembers(set_key)
+        members = await pipe.execute()
+
+    user_hashes = [
+        (set_key, set_key.split(":", 1)[1], list(token_hashes))
+        for set_key, token_hashes in zip(set_keys, members)
+        if token_hashes
+    ]
+    async with redis.pipeline(transaction=False) as pipe:
+        for _, user_id, token_hashes in user_hashes:
+            for token_hash in token_hashes:
+                pipe.exists(refresh_token_key(user_id, token_hash))
+        alive = iter(await pipe.execute())
+
+    removed = 0
+    async with redis.pipeline(transaction=False) as pipe:
+        for set_key, _, token_hashes in user_hashes:
+            expired = [token_hash for token_hash in token_hashes if not next(alive)]
+            if expired:
+                # SREM, not UNLINK: a login may have added a digest since SMEMBERS.
+                # Redis deletes the set once it is empty.
+                pipe.srem(set_key, *expired)
+            removed += len(expired)
+        await pipe.execute()
+    return removed
+
+
+async def _cleanup_expired_tokens() -> int:
+    """Prune expired refresh tokens from every user's token set."""
+    redis = await get_redis()
+    removed = 0
+    cursor = 0
+    while True:
+        # SCAN rather than KEYS, so Redis is never blocked for the whole keyspace
+        cursor, set_keys = await redis.scan(
+            cursor, match=user_refresh_key("*"), count=TOKEN_SCAN_COUNT
+        )
+        if set_keys:
+            removed += await _prune_token_sets(set_keys)
+        if cursor == 0:
+            return removed
+
+
+@celery_app.task(name="app.tasks.cleanup.cleanup_expired_tokens", ignore_result=True)
 def cleanup_expired_tokens() -> int:
     """
     Clean up expired JWT refresh tokens.
 
+    Token keys expire through their Redis TTL, but their digests stay in
+    the owning user's token set, which is extended on every login.
+
     Returns:
         int: Number of tokens deleted
     """
     logger.info("Cleaning up expired tokens...")
 
-    # TODO: Implement token cleanup logic
-    # 1. Query for expired tokens from database/Redis
-    # 2. Delete expired tokens
-    # 3. Return count of deleted tokens
-
-    deleted_count = 0
-    logger.info(f"Cleaned up {deleted_count} expired tokens")
+    deleted_count = run_async(_cleanup_expired_tokens())
+    logger.info("Cleaned up {} expired tokens", deleted_count)
 
     return deleted_count
 
 
-@celery_app.task(name="app.tasks.cleanup.cleanup_old_audit_logs")
+@celery_app.task(name="app.tasks.cleanup.cleanup_old_audit_logs", ignore_result=True)
 def cleanup_old_audit_logs() -> int:
     """
     Clean up old audit logs (older than 90 days).
@@ -41,9 +129,9 @@ def cleanup_old_audit_logs() -> int:
     # 3. Archive or delete old logs
     # 4. Return count of deleted logs
 
-    cutoff_date = datetime.utcnow() - timedelta(days=90)
+    cutoff_date = utcnow() - timedelta(days=90)
     deleted_count = 0
-    logger.info(f"Cleaned up {deleted_count} audit logs older than {cutoff_date}")
+    logger.info("Cleaned up {} audit logs older than {}", deleted_count, cutoff_date)
 
     return deleted_count
 
@@ -64,28 +152,34 @@ def cleanup_temp_files() -> int:
     # 3. Return count of deleted files
 
     deleted_count = 0
-    logger.info(f"Cleaned up {deleted_count} temporary files")
+    logger.info("Cleaned up {} temporary files", deleted_count)
 
     return deleted_count
 
 
 @celery_app.task(name="app.tasks.cleanup.cleanup_unverified_users")
-def cleanup_unverified_users() -> int:
+def cleanup_unverified_users(batch_size: int = CLEANUP_BATCH_SIZE) -> int:
     """
     Clean up unverified user accounts (older than 7 days).
 
+    Deletes one batch per run. A full batch means more rows probably remain,
+    so the task re-enqueues itself; a short batch means it is done. This
+    avoids a COUNT/EXISTS scan to decide whether to continue.
+
+    Args:
+        batch_size: Maximum number of users to delete in this run
+
     Returns:
         int: Number of users deleted
     """
     logger.info("Cleaning up unverified users...")
 
-    # TODO: Implement unverified user cleanup
-    # 1. Query for users created more than 7 days ago
-    # 2. Filter for users with email_verified_at = NULL
-    # 3. Delete unverified users
-    # 4. Return count of deleted users
+    cutoff = utcnow() - UNVERIFIED_USER_MAX_AGE
+    deleted_count = run_async(_delete_unverified_users(cutoff, batch_size))
 
-    deleted_count = 0
-    logger.info(f"Cleaned up {deleted_count} unverified users")
+    if deleted_count == batch_size:
+        cleanup_unverified_users.apply_async(kwargs={"batch_size": batch_size}, countdown=1)
+
+    logger.info("Cleaned up {} unverified users", deleted_count)
 
     return deleted_count
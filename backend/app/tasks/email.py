@@ -1,9 +1,49 @@
 """Email-related Celery tasks."""
-from typing import List
+from string import Template
+from typing import Any, List
+from celery.signals import worker_process_shutdown
 from app.celery_app import celery_app
-from app.utils.email import send_email
+from app.tasks._loop import run_async
+from app.utils.email import close_smtp, send_email
 from loguru import logger
 
+# Email bodies, parsed once at import
+_VERIFICATION_BODY = Template("""
+    Welcome to Adminory!
+
+    Please verify your email address by clicking the link below:
+    http://localhost:3000/auth/verify?token=$token
+
+    If you didn't create an account, you can safely ignore this email.
+    """)
+
+_PASSWORD_RESET_BODY = Template("""
+    You requested to reset your password for your Adminory account.
+
+    Click the link below to reset your password:
+    http://localhost:3000/auth/reset-password?token=$token
+
+    This link will expire in 1 hour.
+
+    If you didn't request a password reset, you can safely ignore this email.
+    """)
+
+_WORKSPACE_INVITE_SUBJECT = Template("You've been invited to join $workspace_name")
+_WORKSPACE_INVITE_BODY = Template("""
+    You've been invited to join the workspace "$workspace_name" on Adminory.
+
+    Click the link below to accept the invitation:
+    http://localhost:3000/invites/accept?token=$token
+
+    If you don't have an account, you'll be able to create one after accepting the invitation.
+    """)
+
+
+@worker_process_shutdown.connect
+def close_smtp_connection(**kwargs: Any) -> None:
+    """Close the worker process's shared SMTP connection on shutdown."""
+    run_async(close_smtp())
+
 
 @celery_app.task(name="app.tasks.email.send_email_task")
 def send_email_task(
@@ -24,15 +64,10 @@ def send_email_task(
     Returns:
         bool: True if email sent successfully
     """
-    import asyncio
+    logger.info("Sending email to {} with subject: {}", to, subject)
 
-    logger.info(f"Sending email to {to} with subject: {subject}")
-
-    # Run async send_email in sync context
-    loop = asyncio.get_event_loop()
-    result = loop.run_until_complete(send_email(to, subject, body, html))
-
-    return result
+    # Runs on the worker process's shared event loop
+    return run_async(send_email(to, subject, body, html))
 
 
 @celery_app.task(name="app.tasks.email.send_verification_email")
@@ -48,14 +83,7 @@ def send_verification_email(email: str, verification_token: str) -> bool:
         bool: True if email sent successfully
     """
     subject = "Verify your Adminory account"
-    body = f"""
-    Welcome to Adminory!
-
-    Please verify your email address by clicking the link below:
-    http://localhost:3000/auth/verify?token={verification_token}
-
-    If you didn't create an account, you can safely ignore this email.
-    """
+    body = _VERIFICATION_BODY.substitute(token=verification_token)
 
     return send_email_task([email], subject, body)
 
@@ -73,16 +101,7 @@ def send_password_reset_email(email: str, reset_token: str) -> bool:
         bool: True if email sent successfully
     """
     subject = "Reset your Adminory password"
-    body = f"""
-    You requested to reset your password for your Adminory account.
-
-    Click the link below to reset your password:
-    http://localhost:3000/auth/reset-password?token={reset_token}
-
-    This link will expire in 1 hour.
-
-    If you didn't request a password reset, you can safely ignore this email.
-    """
+    body = _PASSWORD_RESET_BODY.substitute(token=reset_token)
 
     return send_email_task([email], subject, body)
 
@@ -100,14 +119,7 @@ def send_workspace_invite(email: str, workspace_name: str, invite_token: str) ->
     Returns:
         bool: True if email sent successfully
     """
-    subject = f"You've been invited to join {workspace_name}"
-    body = f"""
-    You've been invited to join the workspace "{workspace_name}" on Adminory.
-
-    Click the link below to accept the invitation:
-    http://localhost:3000/invites/accept?token={invite_token}
-
-    If you don't have an account, you'll be able to create one after accepting the invitation.
-    """
+    subject = _WORKSPACE_INVITE_SUBJECT.substitute(workspace_name=workspace_name)
+    body = _WORKSPACE_INVITE_BODY.substitute(workspace_name=workspace_name, token=invite_token)
 
     return send_email_task([email], subject, body)
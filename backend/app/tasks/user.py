@@ -0,0 +1,41 @@
+"""User-related Celery tasks."""
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import or_, update
+from loguru import logger
+
+from app.celery_app import celery_app
+from app.tasks._loop import run_async
+from app.database import AsyncSessionLocal
+from app.models.user import User
+
+
+async def _touch_last_login(user_id: UUID, login_at: datetime) -> int:
+    """Set last_login_at unless a newer login has already been recorded."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(User)
+            .where(
+                User.id == user_id,
+                or_(User.last_login_at.is_(None), User.last_login_at < login_at),
+            )
+            .values(last_login_at=login_at)
+        )
+        await db.commit()
+        return result.rowcount
+
+
+@celery_app.task(name="app.tasks.user.touch_last_login", ignore_result=True)
+def touch_last_login(user_id: str, login_at: str) -> None:
+    """
+    Record a user's last login time.
+
+    Args:
+        user_id: UUID of the user
+        login_at: ISO 8601 timestamp of the login
+    """
+    updated = run_async(_touch_last_login(UUID(user_id), datetime.fromisoformat(login_at)))
+
+    if not updated:
+        logger.debug("Skipped stale last login update for user {}", user_id)
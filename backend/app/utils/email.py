@@ -1,12 +1,125 @@
 """Email sending utilities."""
-from typing import List, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 import aiosmtplib
+from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from loguru import logger
 from app.config import settings
 
 
+class _PooledConnection:
+    """Pool slot holding a (possibly not yet connected) SMTP client."""
+
+    __slots__ = ("client", "sent")
+
+    def __init__(self) -> None:
+        self.client: Optional[aiosmtplib.SMTP] = None
+        self.sent = 0
+
+
+class SmtpPool:
+    """
+    Bounded pool of reusable SMTP connections.
+
+    Each connection pays the TCP/TLS handshake and AUTH once and is shared by
+    successive sends, so up to ``size`` coroutines can send in parallel.
+    Connections are opened lazily and recycled after ``max_messages_per_conn``
+    messages or after any error.
+    """
+
+    def __init__(self, size: int = 5, max_messages_per_conn: int = 100):
+        self.max_messages_per_conn = max_messages_per_conn
+        # LIFO keeps reusing warm connections when load is low
+        self._slots: asyncio.LifoQueue[_PooledConnection] = asyncio.LifoQueue()
+        for _ in range(size):
+            self._slots.put_nowait(_PooledConnection())
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        Borrow a connected SMTP client from the pool.
+
+        Yields:
+            aiosmtplib.SMTP: Connected (and authenticated) SMTP client
+        """
+        slot = await self._slots.get()
+        try:
+            client = slot.client
+            if (
+                client is None
+                or not client.is_connected
+                or slot.sent >= self.max_messages_per_conn
+            ):
+                client = await self._reconnect(slot)
+            try:
+                yield client
+            except BaseException:
+                # Connection state is unknown; reopen it on next use
+                self._discard(slot)
+                raise
+            slot.sent += 1
+        finally:
+            self._slots.put_nowait(slot)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        slots = []
+        while not self._slots.empty():
+            slots.append(self._slots.get_nowait())
+        for slot in slots:
+            if slot.client is not None and slot.client.is_connected:
+                try:
+                    await slot.client.quit()
+                except aiosmtplib.SMTPException:
+                    slot.client.close()
+            slot.client = None
+            self._slots.put_nowait(slot)
+
+    async def _reconnect(self, slot: _PooledConnection) -> aiosmtplib.SMTP:
+        """Replace the slot's client with a freshly connected one and return it."""
+        if slot.client is not None and slot.client.is_connected:
+            try:
+                await slot.client.quit()
+            except aiosmtplib.SMTPException:
+                slot.client.close()
+        slot.client = None
+        slot.sent = 0
+
+        client = aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USER or None,
+            password=settings.SMTP_PASSWORD or None,
+            use_tls=settings.SMTP_SSL,
+            start_tls=settings.SMTP_TLS and not settings.SMTP_SSL,
+        )
+        await client.connect()
+        slot.client = client
+        return client
+
+    @staticmethod
+    def _discard(slot: _PooledConnection) -> None:
+        """Drop a connection after an error."""
+        if slot.client is not None:
+            slot.client.close()
+        slot.client = None
+        slot.sent = 0
+
+
+_smtp_pool = SmtpPool(
+    size=settings.SMTP_POOL_SIZE,
+    max_messages_per_conn=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+)
+
+
+async def close_smtp() -> None:
+    """Close the pooled SMTP connections."""
+    await _smtp_pool.close()
+
+
 async def send_email(
     to: List[str],
     subject: str,
@@ -32,34 +145,30 @@ async def send_email(
         return False
 
     try:
-        message = MIMEMultipart("alternative")
+        message: MIMEBase
+        if html:
+            message = MIMEMultipart("alternative")
+            message.attach(MIMEText(body, "plain"))
+            message.attach(MIMEText(html, "html"))
+        else:
+            # Plain text only: send the text part itself, without a multipart wrapper
+            message = MIMEText(body, "plain")
         message["From"] = from_email or settings.SMTP_FROM
         message["To"] = ", ".join(to)
         message["Subject"] = subject
 
-        # Add plain text part
-        text_part = MIMEText(body, "plain")
-        message.attach(text_part)
-
-        # Add HTML part if provided
-        if html:
-            html_part = MIMEText(html, "html")
-            message.attach(html_part)
-
-        # Send email
-        await aiosmtplib.send(
-            message,
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            username=settings.SMTP_USER,
-            password=settings.SMTP_PASSWORD,
-            use_tls=settings.SMTP_TLS,
-            start_tls=not settings.SMTP_SSL,
-        )
+        # Send email over a pooled connection; if the server dropped it
+        # while idle, retry once on a fresh one
+        try:
+            async with _smtp_pool.acquire() as client:
+                await client.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            async with _smtp_pool.acquire() as client:
+                await client.send_message(message)
 
-        logger.info(f"Email sent successfully to {to}")
+        logger.info("Email sent successfully to {}", to)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send email: {e}")
+        logger.error("Failed to send email: {}", e)
         return False
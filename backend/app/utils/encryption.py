@@ -1,22 +1,67 @@
 """Encryption utilities for sensitive data."""
-from cryptography.fernet import Fernet
-from app.config import settings
+from functools import lru_cache
 import base64
+import os
+import time
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from app.config import settings
+
+# Both token formats start with a version byte and a big-endian 64-bit
+# creation timestamp; Fernet tokens always start with 0x80
+_FERNET_VERSION = 0x80
+_AESGCM_VERSION = 0x01
+_HEADER_SIZE = 9
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+# Header, nonce and tag; the ciphertext of an empty string adds nothing
+_MIN_AESGCM_SIZE = _HEADER_SIZE + _NONCE_SIZE + _TAG_SIZE
+
+
+def _key_material() -> bytes:
+    """Encryption key as Fernet expects it (base64-encoded 32 bytes)."""
+    key = settings.ENCRYPTION_KEY.encode()
+    # Convert to base64 if needed (Fernet requires base64-encoded 32-byte key)
+    if len(key) == 32:
+        key = base64.urlsafe_b64encode(key)
+    return key
 
 
+@lru_cache(maxsize=1)
 def get_fernet() -> Fernet:
     """
     Get Fernet cipher instance.
 
+    Built once; the encryption key does not change at runtime. Only used to
+    decrypt values written before the switch to AES-GCM.
+
     Returns:
         Fernet: Fernet cipher instance
     """
-    # Ensure the encryption key is properly formatted
-    key = settings.ENCRYPTION_KEY.encode()
-    # Convert to base64 if needed (Fernet requires base64-encoded 32-byte key)
-    if len(key) == 32:
-        key = base64.urlsafe_b64encode(key)
-    return Fernet(key)
+    return Fernet(_key_material())
+
+
+@lru_cache(maxsize=1)
+def get_aead() -> AESGCM:
+    """
+    Get AES-256-GCM cipher instance.
+
+    The key is derived from ENCRYPTION_KEY with HKDF so it is never the same
+    key Fernet uses.
+
+    Returns:
+        AESGCM: AES-GCM cipher instance
+    """
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"adminory-aes-gcm",
+    ).derive(base64.urlsafe_b64decode(_key_material()))
+    return AESGCM(key)
 
 
 def encrypt_string(plaintext: str) -> str:
@@ -29,21 +74,70 @@ def encrypt_string(plaintext: str) -> str:
     Returns:
         str: Encrypted string (base64 encoded)
     """
-    f = get_fernet()
-    encrypted = f.encrypt(plaintext.encode())
-    return encrypted.decode()
+    # The cleartext header is authenticated as associated data
+    header = bytes((_AESGCM_VERSION,)) + int(time.time()).to_bytes(8, "big")
+    nonce = os.urandom(_NONCE_SIZE)
+    ciphertext = get_aead().encrypt(nonce, plaintext.encode(), header)
+    return base64.urlsafe_b64encode(header + nonce + ciphertext).decode()
 
 
 def decrypt_string(encrypted: str) -> str:
     """
     Decrypt a string.
 
+    Accepts both AES-GCM tokens and legacy Fernet tokens.
+
     Args:
         encrypted: Encrypted string (base64 encoded)
 
     Returns:
         str: Decrypted plaintext string
+
+    Raises:
+        InvalidToken: If the token is malformed or fails authentication
     """
-    f = get_fernet()
-    decrypted = f.decrypt(encrypted.encode())
+    try:
+        token = base64.urlsafe_b64decode(encrypted)
+    except ValueError as e:
+        raise InvalidToken from e
+
+    if token[:1] == bytes((_FERNET_VERSION,)):
+        return get_fernet().decrypt(encrypted.encode()).decode()
+
+    if token[:1] != bytes((_AESGCM_VERSION,)) or len(token) < _MIN_AESGCM_SIZE:
+        raise InvalidToken
+
+    header = token[:_HEADER_SIZE]
+    nonce = token[_HEADER_SIZE:_HEADER_SIZE + _NONCE_SIZE]
+    try:
+        decrypted = get_aead().decrypt(nonce, token[_HEADER_SIZE + _NONCE_SIZE:], header)
+    except InvalidTag as e:
+        raise InvalidToken from e
     return decrypted.decode()
+
+
+def token_timestamp(encrypted: str) -> int:
+    """
+    Read when a token was created without decrypting it.
+
+    The timestamp is not verified here; use it to skip obviously expired
+    tokens cheaply, and rely on decrypt_string for anything trusted.
+
+    Args:
+        encrypted: Encrypted string (base64 encoded)
+
+    Returns:
+        int: Creation time as a Unix timestamp
+
+    Raises:
+        InvalidToken: If the token is malformed
+    """
+    try:
+        token = base64.urlsafe_b64decode(encrypted)
+    except ValueError as e:
+        raise InvalidToken from e
+    if len(token) < _HEADER_SIZE or token[0] not in (_FERNET_VERSION, _AESGCM_VERSION):
+        raise InvalidToken
+    if token[0] == _AESGCM_VERSION and len(token) < _MIN_AESGCM_SIZE:
+        raise InvalidToken
+    return int.from_bytes(token[1:_HEADER_SIZE], "big")
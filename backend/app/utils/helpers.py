@@ -1,17 +1,51 @@
 """Helper utility functions."""
+import os
+import re
+import time
 import uuid
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+_RE_NON_SLUG = re.compile(r"[^\w\s-]")
+_RE_SEPARATORS = re.compile(r"[\s_-]+")
+_RE_EDGE_DASHES = re.compile(r"^-+|-+$")
+_RE_DASHES = re.compile(r"-{2,}")
+
+# ASCII equivalent of the three regex passes above: separators become "-",
+# other punctuation is dropped
+_SLUG_ASCII_TABLE = {
+    code: "-" if char.isspace() or char in "_-" else (char if char.isalnum() else None)
+    for code, char in ((code, chr(code)) for code in range(128))
+}
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land at the right-hand edge of the index instead of at random pages.
+
+    Returns:
+        uuid.UUID: UUIDv7
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Overwrite the version (0111) and variant (10) bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
 
 
 def generate_uuid() -> str:
     """
-    Generate a new UUID.
+    Generate a new time-ordered UUID.
 
     Returns:
-        str: UUID string
+        str: UUID as 32 hex digits, without hyphens
     """
-    return str(uuid.uuid4())
+    return uuid7().hex
 
 
 def slugify(text: str) -> str:
@@ -24,23 +58,43 @@ def slugify(text: str) -> str:
     Returns:
         str: Slugified text
     """
-    import re
-
     text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
-    text = re.sub(r"^-+|-+$", "", text)
-    return text
+    if text.isascii():
+        return _RE_DASHES.sub("-", text.translate(_SLUG_ASCII_TABLE)).strip("-")
+    text = _RE_NON_SLUG.sub("", text)
+    text = _RE_SEPARATORS.sub("-", text)
+    return _RE_EDGE_DASHES.sub("", text)
 
 
 def utcnow() -> datetime:
     """
     Get current UTC datetime.
 
+    Naive, to match the ``timestamp without time zone`` columns it is
+    compared with and written to.
+
     Returns:
         datetime: Current UTC datetime
     """
-    return datetime.utcnow()
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime to naive UTC.
+
+    Timezone-aware values are shifted to UTC; naive values are assumed to
+    already be UTC and returned unchanged.
+
+    Args:
+        value: Datetime to convert
+
+    Returns:
+        datetime: Naive UTC datetime
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 def parse_boolean(value: Optional[str]) -> bool:
@@ -53,6 +107,4 @@ def parse_boolean(value: Optional[str]) -> bool:
     Returns:
         bool: Boolean value
     """
-    if value is None:
-        return False
-    return value.lower() in ("true", "1", "yes", "on")
+    return value is not None and value.lower() in _TRUTHY
@@ -1,12 +1,46 @@
 """Security utilities for JWT and password hashing."""
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import json
+import jwt
+import msgspec
+import orjson
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
 from app.config import settings
+from app.schemas.auth import TokenPayload
 
-# Password hashing context using Argon2
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Argon2id password hasher (argon2-cffi, C reference implementation)
+_password_hasher = PasswordHasher(
+    time_cost=3,
+    memory_cost=64 * 1024,
+    parallelism=4,
+    hash_len=32,
+    type=Type.ID,
+)
+
+# Signing/verification keys and allowed algorithms, resolved once at import
+_ALGORITHM = settings.JWT_ALGORITHM
+_SECRETS = {
+    "access": settings.JWT_SECRET,
+    "refresh": settings.JWT_REFRESH_SECRET,
+}
+_ALGORITHMS = [_ALGORITHM]
+
+# Parsed key objects, so asymmetric keys (e.g. EdDSA PEMs) are loaded once
+# rather than on every encode/decode
+_KEYS = {
+    token_type: jwt.get_algorithm_by_name(_ALGORITHM).prepare_key(secret)
+    for token_type, secret in _SECRETS.items()
+}
+
+
+class _OrjsonEncoder(json.JSONEncoder):
+    """JSON encoder for PyJWT that serializes header and claims with orjson."""
+
+    def encode(self, o: Any) -> str:
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else None
+        return orjson.dumps(o, option=option).decode()
 
 
 def hash_password(password: str) -> str:
@@ -19,7 +53,7 @@ def hash_password(password: str) -> str:
     Returns:
         str: Hashed password
     """
-    return pwd_context.hash(password)
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -33,51 +67,81 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check if a hash was created with outdated Argon2 parameters.
+
+    Args:
+        hashed_password: Hashed password
+
+    Returns:
+        bool: True if the password should be re-hashed
+    """
+    return _password_hasher.check_needs_rehash(hashed_password)
+
+
+def _now_utc() -> datetime:
+    """Get the current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
 
 
-def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+def _encode_jwt(claims: dict[str, Any], token_type: str) -> str:
+    """Sign claims with the key for ``token_type``."""
+    return jwt.encode(claims, _KEYS[token_type], algorithm=_ALGORITHM, json_encoder=_OrjsonEncoder)
+
+
+def create_access_token(
+    data: dict[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    now: Optional[datetime] = None,
+) -> str:
     """
     Create a JWT access token.
 
     Args:
         data: Data to encode in the token
         expires_delta: Optional expiration time delta
+        now: Optional issue time, defaults to the current time
 
     Returns:
         str: Encoded JWT token
     """
+    if now is None:
+        now = _now_utc()
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(to_encode, "access")
 
 
-def create_refresh_token(data: dict[str, Any]) -> str:
+def create_refresh_token(data: dict[str, Any], now: Optional[datetime] = None) -> str:
     """
     Create a JWT refresh token.
 
     Args:
         data: Data to encode in the token
+        now: Optional issue time, defaults to the current time
 
     Returns:
         str: Encoded JWT refresh token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = (now or _now_utc()) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_REFRESH_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
-    return encoded_jwt
+    return _encode_jwt(to_encode, "refresh")
 
 
-def decode_token(token: str, token_type: str = "access") -> Optional[dict[str, Any]]:
+def decode_token(token: str, token_type: str = "access") -> Optional[TokenPayload]:
     """
     Decode and verify a JWT token.
 
@@ -86,16 +150,18 @@ def decode_token(token: str, token_type: str = "access") -> Optional[dict[str, A
         token_type: Type of token ("access" or "refresh")
 
     Returns:
-        Optional[dict]: Decoded token payload or None if invalid
+        Optional[TokenPayload]: Decoded token payload or None if invalid
     """
     try:
-        secret = settings.JWT_SECRET if token_type == "access" else settings.JWT_REFRESH_SECRET
-        payload = jwt.decode(token, secret, algorithms=[settings.JWT_ALGORITHM])
-
-        # Verify token type
-        if payload.get("type") != token_type:
-            return None
+        key = _KEYS.get(token_type, _KEYS["refresh"])
+        payload = msgspec.convert(
+            jwt.decode(token, key, algorithms=_ALGORITHMS), type=TokenPayload
+        )
+    except (jwt.PyJWTError, msgspec.ValidationError):
+        return None
 
-        return payload
-    except JWTError:
+    # Verify token type
+    if payload.type != token_type:
         return None
+
+    return payload
@@ -0,0 +1,81 @@
+"""Process pool for running password hashing off the event loop."""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from app.utils.security import hash_password, verify_password
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def start_pool() -> ProcessPoolExecutor:
+    """
+    Create the password hashing process pool.
+
+    Workers are spawned rather than forked: the parent already runs an event
+    loop and other threads, whose state a forked child would inherit.
+
+    Returns:
+        ProcessPoolExecutor: Pool sized to the number of CPU cores
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """
+    Get the password hashing process pool.
+
+    The API creates it at startup; other callers get it created on first use.
+
+    Returns:
+        ProcessPoolExecutor: Pool sized to the number of CPU cores
+    """
+    return _pool if _pool is not None else start_pool()
+
+
+def shutdown_pool() -> None:
+    """
+    Shut down the password hashing process pool.
+
+    Blocks until the workers exit; call it from async code via a thread.
+    """
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+async def ahash(password: str) -> str:
+    """
+    Hash a password in the process pool.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        str: Hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pool(), hash_password, password)
+
+
+async def averify(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a hash in the process pool.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password
+
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pool(), verify_password, plain_password, hashed_password)
@@ -8,9 +8,9 @@ Usage:
     python test_auth.py
 """
 
-import requests
+import asyncio
+import httpx
 import json
-import time
 from typing import Dict, Optional
 
 BASE_URL = "http://localhost:8000"
@@ -22,6 +22,12 @@ class AuthTester:
         self.refresh_token: Optional[str] = None
         self.user_data: Optional[Dict] = None
 
+        # One keep-alive connection pool for every request in the run
+        self.client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+
     def print_success(self, message: str):
         print(f"✅ {message}")
 
@@ -31,14 +37,14 @@ class AuthTester:
     def print_info(self, message: str):
         print(f"ℹ️  {message}")
 
-    def test_health(self):
+    async def test_health(self):
         """Test health endpoint"""
         print("\n" + "="*50)
         print("Testing Health Endpoint")
         print("="*50)
 
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = await self.client.get("/health")
             if response.status_code == 200:
                 self.print_success("Health check passed")
                 print(f"Response: {response.json()}")
@@ -47,9 +53,9 @@ class AuthTester:
         except Exception as e:
             self.print_error(f"Health check error: {e}")
 
-    def test_register(self, email: str = "test@adminory.dev",
-                     password: str = "testpassword123",
-                     name: str = "Test User"):
+    async def test_register(self, email: str = "test@adminory.dev",
+                            password: str = "testpassword123",
+                            name: str = "Test User"):
         """Test user registration"""
         print("\n" + "="*50)
         print("Testing User Registration")
@@ -62,8 +68,8 @@ class AuthTester:
         }
 
         try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/register",
+            response = await self.client.post(
+                "/api/auth/register",
                 json=payload
             )
 
@@ -82,8 +88,8 @@ class AuthTester:
             self.print_error(f"Registration error: {e}")
             return False
 
-    def test_login(self, email: str = "test@adminory.dev",
-                   password: str = "testpassword123"):
+    async def test_login(self, email: str = "test@adminory.dev",
+                         password: str = "testpassword123"):
         """Test user login"""
         print("\n" + "="*50)
         print("Testing User Login")
@@ -95,8 +101,8 @@ class AuthTester:
         }
 
         try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/login",
+            response = await self.client.post(
+                "/api/auth/login",
                 json=payload
             )
 
@@ -120,7 +126,7 @@ class AuthTester:
             self.print_error(f"Login error: {e}")
             return False
 
-    def test_get_current_user(self):
+    async def test_get_current_user(self):
         """Test getting current user info"""
         print("\n" + "="*50)
         print("Testing Get Current User")
@@ -133,8 +139,8 @@ class AuthTester:
         headers = {"Authorization": f"Bearer {self.access_token}"}
 
         try:
-            response = requests.get(
-                f"{self.base_url}/api/auth/me",
+            response = await self.client.get(
+                "/api/auth/me",
                 headers=headers
             )
 
@@ -150,7 +156,7 @@ class AuthTester:
             self.print_error(f"Get current user error: {e}")
             return False
 
-    def test_refresh_token(self):
+    async def test_refresh_token(self):
         """Test token refresh"""
         print("\n" + "="*50)
         print("Testing Token Refresh")
@@ -163,8 +169,8 @@ class AuthTester:
         payload = {"refresh_token": self.refresh_token}
 
         try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/refresh",
+            response = await self.client.post(
+                "/api/auth/refresh",
                 json=payload
             )
 
@@ -185,7 +191,7 @@ class AuthTester:
             self.print_error(f"Token refresh error: {e}")
             return False
 
-    def test_protected_endpoint(self):
+    async def test_protected_endpoint(self):
         """Test accessing protected endpoint"""
         print("\n" + "="*50)
         print("Testing Protected Endpoint Access")
@@ -193,7 +199,7 @@ class AuthTester:
 
         # Test without token
         self.print_info("Testing without authentication...")
-        response = requests.get(f"{self.base_url}/api/auth/me")
+        response = await self.client.get("/api/auth/me")
         if response.status_code == 401:
             self.print_success("Correctly rejected unauthenticated request")
         else:
@@ -203,8 +209,8 @@ class AuthTester:
         if self.access_token:
             self.print_info("Testing with authentication...")
             headers = {"Authorization": f"Bearer {self.access_token}"}
-            response = requests.get(
-                f"{self.base_url}/api/auth/me",
+            response = await self.client.get(
+                "/api/auth/me",
                 headers=headers
             )
             if response.status_code == 200:
@@ -212,7 +218,7 @@ class AuthTester:
             else:
                 self.print_error("Should have allowed authenticated request")
 
-    def test_logout(self):
+    async def test_logout(self):
         """Test user logout"""
         print("\n" + "="*50)
         print("Testing User Logout")
@@ -225,8 +231,8 @@ class AuthTester:
         headers = {"Authorization": f"Bearer {self.access_token}"}
 
         try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/logout",
+            response = await self.client.post(
+                "/api/auth/logout",
                 headers=headers,
                 params={"refresh_token": self.refresh_token}
             )
@@ -236,10 +242,10 @@ class AuthTester:
 
                 # Try to use the old token
                 self.print_info("Verifying token was revoked...")
-                time.sleep(1)  # Give Redis a moment
+                await asyncio.sleep(1)  # Give Redis a moment
 
-                refresh_response = requests.post(
-                    f"{self.base_url}/api/auth/refresh",
+                refresh_response = await self.client.post(
+                    "/api/auth/refresh",
                     json={"refresh_token": self.refresh_token}
                 )
 
@@ -256,34 +262,26 @@ class AuthTester:
             self.print_error(f"Logout error: {e}")
             return False
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all authentication tests"""
         print("\n" + "🚀 " * 25)
         print("Adminory Authentication System Test")
         print("🚀 " * 25)
 
-        # Test health
-        self.test_health()
-
-        # Test registration
-        self.test_register()
+        # Health and registration are independent of each other
+        await asyncio.gather(self.test_health(), self.test_register())
 
         # Test login
-        if not self.test_login():
+        if not await self.test_login():
             print("\n❌ Login failed, cannot continue tests")
             return
 
-        # Test getting current user
-        self.test_get_current_user()
-
-        # Test protected endpoint access
-        self.test_protected_endpoint()
-
-        # Test token refresh
-        self.test_refresh_token()
+        # Both only read the access token from login
+        await asyncio.gather(self.test_get_current_user(), self.test_protected_endpoint())
 
-        # Test logout
-        self.test_logout()
+        # Refresh and logout each consume the current refresh token, so stay sequential
+        await self.test_refresh_token()
+        await self.test_logout()
 
         # Summary
         print("\n" + "="*50)
@@ -297,6 +295,15 @@ class AuthTester:
         print("4. Try protected routes with different roles")
 
 
+async def main():
+    """Run the authentication tests."""
+    tester = AuthTester()
+    try:
+        await tester.run_all_tests()
+    finally:
+        await tester.client.aclose()
+
+
 if __name__ == "__main__":
     print("Starting authentication tests...")
     print(f"Backend URL: {BASE_URL}")
@@ -308,5 +315,4 @@ if __name__ == "__main__":
 
     input("Press Enter to continue...")
 
-    tester = AuthTester()
-    tester.run_all_tests()
+    asyncio.run(main())
@@ -1,6 +1,7 @@
 """Test script for workspace management endpoints."""
 import asyncio
 import httpx
+import orjson
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -17,13 +18,35 @@ class Colors:
     BOLD = '\033[1m'
 
 
+BANNER = '=' * 60
+
+# Request bodies are encoded with orjson and sent as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Colorized message prefixes, built once
+HEADER_PREFIX = Colors.HEADER + Colors.BOLD
+HEADER_RULE = f"{HEADER_PREFIX}{BANNER}{Colors.ENDC}"
+SUCCESS_PREFIX = f"{Colors.OKGREEN}✓ "
+ERROR_PREFIX = f"{Colors.FAIL}✗ "
+INFO_PREFIX = f"{Colors.OKCYAN}ℹ "
+WARNING_PREFIX = f"{Colors.WARNING}⚠ "
+
+
 class WorkspaceTester:
     """Test workspace management functionality."""
 
     def __init__(self, base_url: str = "http://localhost:8000"):
         """Initialize tester."""
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # Keep connections warm across the whole suite instead of reconnecting per test
+        self.client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+        )
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
         self.user_id: Optional[str] = None
@@ -32,25 +55,23 @@ class WorkspaceTester:
 
     def print_header(self, text: str) -> None:
         """Print section header."""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{text}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}\n")
+        print(f"\n{HEADER_RULE}\n{HEADER_PREFIX}{text}{Colors.ENDC}\n{HEADER_RULE}\n")
 
     def print_success(self, text: str) -> None:
         """Print success message."""
-        print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+        print(SUCCESS_PREFIX + text + Colors.ENDC)
 
     def print_error(self, text: str) -> None:
         """Print error message."""
-        print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
+        print(ERROR_PREFIX + text + Colors.ENDC)
 
     def print_info(self, text: str) -> None:
         """Print info message."""
-        print(f"{Colors.OKCYAN}ℹ {text}{Colors.ENDC}")
+        print(INFO_PREFIX + text + Colors.ENDC)
 
     def print_warning(self, text: str) -> None:
         """Print warning message."""
-        print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+        print(WARNING_PREFIX + text + Colors.ENDC)
 
     async def test_health(self) -> bool:
         """Test health endpoint."""
@@ -58,7 +79,7 @@ class WorkspaceTester:
         try:
             response = await self.client.get(f"{self.base_url}/health")
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_success(f"Health check passed: {data}")
                 return True
             else:
@@ -74,10 +95,11 @@ class WorkspaceTester:
         try:
             response = await self.client.post(
                 f"{self.base_url}/api/auth/register",
-                json={"email": email, "password": password, "name": name}
+                content=orjson.dumps({"email": email, "password": password, "name": name}),
+                headers=JSON_HEADERS
             )
             if response.status_code == 201:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_success(f"Registration successful: {data['email']}")
                 return True
             elif response.status_code == 400:
@@ -96,13 +118,16 @@ class WorkspaceTester:
         try:
             response = await self.client.post(
                 f"{self.base_url}/api/auth/login",
-                json={"email": email, "password": password}
+                content=orjson.dumps({"email": email, "password": password}),
+                headers=JSON_HEADERS
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.access_token = data["access_token"]
                 self.refresh_token = data["refresh_token"]
                 self.user_id = data["user"]["id"]
+                # Sent with every later request
+                self.client.headers["Authorization"] = f"Bearer {self.access_token}"
                 self.print_success(f"Login successful: {data['user']['email']}")
                 self.print_info(f"User ID: {self.user_id}")
                 return True
@@ -117,18 +142,17 @@ class WorkspaceTester:
         """Test workspace creation."""
         self.print_header("Testing Workspace Creation")
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
             payload = {"name": name}
             if slug:
                 payload["slug"] = slug
 
             response = await self.client.post(
                 f"{self.base_url}/api/external/workspaces",
-                json=payload,
-                headers=headers
+                content=orjson.dumps(payload),
+                headers=JSON_HEADERS
             )
             if response.status_code == 201:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.workspace_id = data["id"]
                 self.print_success(f"Workspace created: {data['name']} ({data['slug']})")
                 self.print_info(f"Workspace ID: {self.workspace_id}")
@@ -146,13 +170,11 @@ class WorkspaceTester:
         """Test listing workspaces."""
         self.print_header("Testing List Workspaces")
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
             response = await self.client.get(
-                f"{self.base_url}/api/external/workspaces",
-                headers=headers
+                f"{self.base_url}/api/external/workspaces"
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_success(f"Found {len(data)} workspace(s)")
                 for ws in data:
                     self.print_info(f"  - {ws['name']} ({ws['slug']}) - Role: {ws.get('user_role', 'N/A')}")
@@ -172,13 +194,11 @@ class WorkspaceTester:
             return True
 
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
             response = await self.client.get(
-                f"{self.base_url}/api/external/workspaces/{self.workspace_id}",
-                headers=headers
+                f"{self.base_url}/api/external/workspaces/{self.workspace_id}"
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_success(f"Workspace details retrieved: {data['name']}")
                 self.print_info(f"Members: {len(data.get('members', []))}")
                 self.print_info(f"SSO Enabled: {data['sso_enabled']}")
@@ -191,7 +211,7 @@ class WorkspaceTester:
             self.print_error(f"Get workspace error: {str(e)}")
             return False
 
-    async def test_update_workspace(self) -> bool:
+    async def test_update_workspace(self, new_name: str) -> bool:
         """Test updating workspace."""
         self.print_header("Testing Update Workspace")
         if not self.workspace_id:
@@ -199,15 +219,13 @@ class WorkspaceTester:
             return True
 
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            new_name = f"Updated Workspace {datetime.now().strftime('%H:%M:%S')}"
             response = await self.client.patch(
                 f"{self.base_url}/api/external/workspaces/{self.workspace_id}",
-                json={"name": new_name},
-                headers=headers
+                content=orjson.dumps({"name": new_name}),
+                headers=JSON_HEADERS
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_success(f"Workspace updated: {data['name']}")
                 return True
             else:
@@ -225,13 +243,11 @@ class WorkspaceTester:
             return True
 
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
             response = await self.client.get(
-                f"{self.base_url}/api/external/workspaces/{self.workspace_id}/members",
-                headers=headers
+                f"{self.base_url}/api/external/workspaces/{self.workspace_id}/members"
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_success(f"Found {len(data)} member(s)")
                 for member in data:
                     self.print_info(f"  - User {member['user_id'][:8]}... - Role: {member['role']}")
@@ -249,13 +265,11 @@ class WorkspaceTester:
         """Test getting workspace by slug."""
         self.print_header("Testing Get Workspace By Slug")
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
             response = await self.client.get(
-                f"{self.base_url}/api/external/workspaces/by-slug/{slug}",
-                headers=headers
+                f"{self.base_url}/api/external/workspaces/by-slug/{slug}"
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_success(f"Workspace found by slug: {data['name']} ({data['slug']})")
                 return True
             else:
@@ -267,9 +281,9 @@ class WorkspaceTester:
 
     async def run_all_tests(self) -> None:
         """Run all tests."""
-        print(f"\n{Colors.BOLD}{'=' * 60}")
+        print(f"\n{Colors.BOLD}{BANNER}")
         print(f"Adminory Workspace Management Test Suite")
-        print(f"{'=' * 60}{Colors.ENDC}\n")
+        print(f"{BANNER}{Colors.ENDC}\n")
 
         # Unique test user
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -278,30 +292,48 @@ class WorkspaceTester:
         test_name = "Workspace Tester"
         workspace_name = f"Test Workspace {timestamp}"
         workspace_slug = f"test-workspace-{timestamp}"
+        updated_workspace_name = f"Updated Workspace {timestamp}"
 
         results = []
 
-        # Run tests in sequence
+        # Setup steps depend on each other, so run them in sequence
         results.append(("Health Check", await self.test_health()))
         results.append(("Register User", await self.test_register(test_email, test_password, test_name)))
         results.append(("Login", await self.test_login(test_email, test_password)))
         results.append(("Create Workspace", await self.test_create_workspace(workspace_name, workspace_slug)))
-        results.append(("List Workspaces", await self.test_list_workspaces()))
-        results.append(("Get Workspace", await self.test_get_workspace()))
-        results.append(("Update Workspace", await self.test_update_workspace()))
-        results.append(("List Members", await self.test_list_members()))
-        results.append(("Get by Slug", await self.test_workspace_by_slug(workspace_slug)))
+
+        # Read-only checks are independent; run them concurrently
+        read_tests = [
+            ("List Workspaces", self.test_list_workspaces()),
+            ("Get Workspace", self.test_get_workspace()),
+            ("List Members", self.test_list_members()),
+            ("Get by Slug", self.test_workspace_by_slug(workspace_slug)),
+        ]
+        read_results = await asyncio.gather(
+            *(test for _, test in read_tests),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(read_tests, read_results):
+            if isinstance(result, BaseException):
+                self.print_error(f"{name} error: {result}")
+                result = False
+            results.append((name, result))
+
+        # Update last, so it cannot race the reads above
+        update_result = await self.test_update_workspace(updated_workspace_name)
+        results.append(("Update Workspace", update_result))
 
         # Print summary
         self.print_header("Test Summary")
         passed = sum(1 for _, result in results if result)
         total = len(results)
 
-        for test_name, result in results:
-            if result:
-                self.print_success(f"{test_name}: PASSED")
-            else:
-                self.print_error(f"{test_name}: FAILED")
+        # One write for the whole result list
+        print("\n".join(
+            f"{SUCCESS_PREFIX}{test_name}: PASSED{Colors.ENDC}" if result
+            else f"{ERROR_PREFIX}{test_name}: FAILED{Colors.ENDC}"
+            for test_name, result in results
+        ))
 
         print(f"\n{Colors.BOLD}Total: {passed}/{total} tests passed{Colors.ENDC}")
 
@@ -310,13 +342,14 @@ class WorkspaceTester:
         else:
             print(f"\n{Colors.FAIL}{Colors.BOLD}❌ Some tests failed{Colors.ENDC}\n")
 
-        await self.client.aclose()
-
 
 async def main():
     """Main test runner."""
     tester = WorkspaceTester()
-    await tester.run_all_tests()
+    try:
+        await tester.run_all_tests()
+    finally:
+        await tester.client.aclose()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,19 @@
+"""Tests for analytics tasks."""
+from uuid import uuid4
+
+import pytest
+
+from app.tasks.analytics import generate_report
+
+
+@pytest.mark.parametrize(
+    "workspace_id, report_type",
+    [
+        (str(uuid4()), "../x"),
+        (str(uuid4()), "monthly"),
+        ("../x", "hourly"),
+    ],
+)
+def test_generate_report_rejects_invalid_arguments(workspace_id, report_type):
+    with pytest.raises(ValueError):
+        generate_report(workspace_id, report_type)
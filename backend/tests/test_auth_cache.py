@@ -0,0 +1,135 @@
+"""Tests for the per-process authenticated user cache."""
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from cachetools import TTLCache
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api import deps
+from app.models.user import User, UserRole
+from app.utils.security import create_access_token, decode_token
+
+
+class _FakeTimer:
+    """Manually advanced clock for TTLCache."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeSession:
+    """Stands in for AsyncSession.get, counting lookups."""
+
+    def __init__(self, user):
+        self.user = user
+        self.gets = 0
+
+    async def get(self, model, ident):
+        self.gets += 1
+        return self.user
+
+
+@pytest.fixture
+def timer(monkeypatch):
+    """Give each test an empty auth cache driven by a fake clock."""
+    clock = _FakeTimer()
+    monkeypatch.setattr(
+        deps, "_auth_cache", TTLCache(maxsize=100, ttl=deps.AUTH_CACHE_TTL, timer=clock)
+    )
+    return clock
+
+
+def _user(**overrides) -> User:
+    fields = {
+        "id": uuid4(),
+        "email": "a@example.com",
+        "name": "A",
+        "role": UserRole.USER,
+        "is_active": True,
+    }
+    fields.update(overrides)
+    return User(**fields)
+
+
+def _login(user: User, minutes: int = 15) -> str:
+    """Issue an access token for a user and cache it as get_current_user would."""
+    token = create_access_token(user.token_claims, expires_delta=timedelta(minutes=minutes))
+    deps._cache_user(token, decode_token(token), user)
+    return token
+
+
+async def _authenticate(token: str, db: _FakeSession) -> User:
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return await deps.get_current_user(credentials, db)
+
+
+@pytest.mark.asyncio
+async def test_cached_token_skips_the_database(timer):
+    user = _user()
+    token = _login(user)
+    db = _FakeSession(user)
+
+    cached = await _authenticate(token, db)
+
+    assert cached.id == user.id
+    assert cached is not user  # detached snapshot
+    assert db.gets == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cached_token_drops_only_that_token(timer):
+    user = _user()
+    logged_out, other = _login(user), _login(user, minutes=30)
+
+    deps.invalidate_cached_token(logged_out)
+
+    assert deps._get_cached_user(logged_out) is None
+    assert deps._get_cached_user(other) is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cached_user_drops_every_token_of_that_user(timer):
+    user, bystander = _user(), _user(email="b@example.com")
+    tokens = [_login(user), _login(user, minutes=30)]
+    bystander_token = _login(bystander)
+
+    deps.invalidate_cached_user(user.id)
+
+    assert all(deps._get_cached_user(token) is None for token in tokens)
+    assert deps._get_cached_user(bystander_token) is not None
+
+
+@pytest.mark.asyncio
+async def test_deactivation_is_seen_after_invalidation(timer):
+    user = _user()
+    token = _login(user)
+    db = _FakeSession(_user(id=user.id, is_active=False))
+
+    deps.invalidate_cached_user(user.id)
+    with pytest.raises(HTTPException) as exc_info:
+        await _authenticate(token, db)
+
+    assert exc_info.value.status_code == 403
+    assert db.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_until_the_ttl_expires(timer):
+    # Another worker deactivated the user; this process was never told
+    user = _user()
+    token = _login(user)
+    db = _FakeSession(_user(id=user.id, is_active=False))
+
+    timer.now = deps.AUTH_CACHE_TTL - 1
+    assert (await _authenticate(token, db)).is_active
+    assert db.gets == 0
+
+    timer.now = deps.AUTH_CACHE_TTL
+    with pytest.raises(HTTPException) as exc_info:
+        await _authenticate(token, db)
+    assert exc_info.value.status_code == 403
@@ -0,0 +1,27 @@
+"""Tests for cleanup tasks."""
+from datetime import timedelta
+
+from app.models.user import User
+from app.tasks.cleanup import UNVERIFIED_USER_MAX_AGE, _unverified_user_ids
+from app.utils.helpers import utcnow, uuid7
+
+
+def _user(**fields) -> User:
+    return User(email=f"{uuid7().hex}@example.com", name="Cleanup", **fields)
+
+
+async def test_unverified_purge_skips_sso_and_recent_users(db_session):
+    cutoff = utcnow() - UNVERIFIED_USER_MAX_AGE
+    stale = cutoff - timedelta(days=1)
+    password_user = _user(password_hash="hash", created_at=stale)
+    sso_user = _user(sso_provider="saml", sso_external_id=uuid7().hex, created_at=stale)
+    verified_user = _user(password_hash="hash", created_at=stale, email_verified_at=stale)
+    recent_user = _user(password_hash="hash")
+    db_session.add_all([password_user, sso_user, verified_user, recent_user])
+    await db_session.flush()
+
+    result = await db_session.execute(_unverified_user_ids(cutoff, batch_size=100))
+    stale_ids = set(result.scalars())
+
+    assert password_user.id in stale_ids
+    assert stale_ids.isdisjoint({sso_user.id, verified_user.id, recent_user.id})
@@ -0,0 +1,121 @@
+"""Tests for the CORS middleware."""
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.middleware.cors import ALLOW_METHODS, FastCORSMiddleware
+
+ALLOWED = "http://allowed.example"
+DISALLOWED = "http://evil.example"
+
+
+async def _endpoint(request):
+    return PlainTextResponse("hello", headers={"Vary": "Accept-Encoding"})
+
+
+def _client(allow_origins) -> AsyncClient:
+    """HTTP client for a one-route app wrapped in FastCORSMiddleware."""
+    app = Starlette(
+        routes=[Route("/", _endpoint, methods=["GET", "OPTIONS"])],
+        middleware=[Middleware(FastCORSMiddleware, allow_origins=allow_origins)],
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+def _preflight_headers(origin: str) -> dict:
+    return {
+        "Origin": origin,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "authorization, content-type",
+    }
+
+
+@pytest.mark.asyncio
+async def test_preflight_allowed_origin():
+    async with _client([ALLOWED]) as client:
+        response = await client.options("/", headers=_preflight_headers(ALLOWED))
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-methods"] == ALLOW_METHODS.decode()
+    assert response.headers["access-control-allow-headers"] == "authorization, content-type"
+    assert response.headers["vary"] == "Origin"
+
+
+@pytest.mark.asyncio
+async def test_preflight_disallowed_origin():
+    async with _client([ALLOWED]) as client:
+        response = await client.options("/", headers=_preflight_headers(DISALLOWED))
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+    assert "access-control-allow-credentials" not in response.headers
+    assert response.headers["vary"] == "Origin"
+
+
+@pytest.mark.asyncio
+async def test_simple_request_allowed_origin():
+    async with _client([ALLOWED]) as client:
+        response = await client.get("/", headers={"Origin": ALLOWED})
+
+    assert response.status_code == 200
+    assert response.text == "hello"
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    assert response.headers["access-control-allow-credentials"] == "true"
+    # Appended to the Vary header the endpoint already set
+    assert response.headers["vary"] == "Accept-Encoding, Origin"
+
+
+@pytest.mark.asyncio
+async def test_simple_request_disallowed_origin():
+    async with _client([ALLOWED]) as client:
+        response = await client.get("/", headers={"Origin": DISALLOWED})
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert "access-control-allow-credentials" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_request_without_origin_passes_through():
+    async with _client([ALLOWED]) as client:
+        response = await client.get("/")
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.asyncio
+async def test_options_without_request_method_reaches_app():
+    async with _client([ALLOWED]) as client:
+        response = await client.options("/", headers={"Origin": ALLOWED})
+
+    assert response.text == "hello"
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+
+
+@pytest.mark.asyncio
+async def test_allowed_origins_are_matched_case_insensitively_from_config():
+    async with _client(["HTTP://Allowed.Example"]) as client:
+        response = await client.get("/", headers={"Origin": ALLOWED})
+
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+
+
+@pytest.mark.asyncio
+async def test_wildcard_echoes_the_request_origin():
+    # Credentialed responses may not use "*", so the origin is echoed
+    async with _client(["*"]) as client:
+        simple = await client.get("/", headers={"Origin": DISALLOWED})
+        preflight = await client.options("/", headers=_preflight_headers(DISALLOWED))
+
+    for response in (simple, preflight):
+        assert response.headers["access-control-allow-origin"] == DISALLOWED
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert "Origin" in response.headers["vary"]
+    assert preflight.status_code == 200
@@ -0,0 +1,25 @@
+"""Tests for request and response schemas."""
+from app.schemas.auth import LoginRequest, RegisterRequest
+from app.schemas.workspace import WorkspaceCreate
+
+
+def test_request_schemas_ignore_unknown_fields():
+    login = LoginRequest.model_validate(
+        {"email": "a@example.com", "password": "secret", "remember_me": True}
+    )
+    register = RegisterRequest.model_validate(
+        {"email": "a@example.com", "password": "password1", "name": "A", "locale": "en"}
+    )
+    workspace = WorkspaceCreate.model_validate({"name": "Acme", "client_version": "1.2"})
+
+    assert "remember_me" not in login.model_dump()
+    assert "locale" not in register.model_dump()
+    assert "client_version" not in workspace.model_dump()
+
+
+def test_request_schemas_are_mutable():
+    login = LoginRequest(email="a@example.com", password="secret")
+
+    login.password = "changed"
+
+    assert login.password == "changed"
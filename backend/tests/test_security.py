@@ -0,0 +1,53 @@
+"""Tests for JWT helpers."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from app.utils.security import (
+    _OrjsonEncoder,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
+
+EXP = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+def test_orjson_encoder_round_trips_through_pyjwt(algorithm):
+    key = "k" * 64
+    claims = {"sub": str(uuid4()), "email": "a@example.com", "exp": EXP, "type": "access"}
+
+    token = jwt.encode(claims, key, algorithm=algorithm, json_encoder=_OrjsonEncoder)
+
+    assert jwt.get_unverified_header(token) == {"alg": algorithm, "typ": "JWT"}
+    assert jwt.decode(token, key, algorithms=[algorithm]) == {
+        **claims,
+        "exp": int(EXP.timestamp()),
+    }
+
+
+def test_access_token_round_trip():
+    sub = uuid4()
+    token = create_access_token({"sub": str(sub), "email": "a@example.com", "role": "user"})
+
+    payload = decode_token(token, token_type="access")
+
+    assert payload is not None
+    assert payload.sub == sub
+    assert payload.type == "access"
+
+
+def test_decode_rejects_wrong_token_type():
+    token = create_refresh_token({"sub": str(uuid4()), "email": "a@example.com", "role": "user"})
+
+    assert decode_token(token, token_type="access") is None
+    assert decode_token(token, token_type="refresh") is not None
+
+
+def test_decode_rejects_expired_token():
+    token = create_access_token({"sub": str(uuid4())}, expires_delta=timedelta(seconds=-1))
+
+    assert decode_token(token, token_type="access") is None
@@ -0,0 +1,62 @@
+"""Tests for workspace context middleware."""
+from uuid import UUID
+
+import pytest
+
+from app.middleware.workspace import WorkspaceContextMiddleware, _parse_uuid_bytes
+
+WORKSPACE_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+async def _run(query_string: bytes = b"", headers: list = None) -> dict:
+    """Run the middleware over a bare HTTP scope and return the scope it forwarded."""
+    forwarded = {}
+
+    async def app(scope, receive, send):
+        forwarded.update(scope)
+
+    scope = {"type": "http", "headers": headers or [], "query_string": query_string}
+    await WorkspaceContextMiddleware(app)(scope, None, None)
+    return forwarded
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (b"12345678-1234-5678-1234-567812345678", WORKSPACE_ID),
+        (b"12345678123456781234567812345678", WORKSPACE_ID),
+        (b"1234567-81234-5678-1234-567812345678", None),  # wrong dash positions
+        (b"zzzzzzzz-1234-5678-1234-567812345678", None),  # not hex
+        (b"zzzzzzzz123456781234567812345678", None),
+        (b"\xe2\x82\xac" * 12, None),  # non-ASCII bytes
+        (b"", None),
+    ],
+)
+def test_parse_uuid_bytes(value, expected):
+    assert _parse_uuid_bytes(value) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query_string, expected",
+    [
+        (b"workspace_id=12345678-1234-5678-1234-567812345678", WORKSPACE_ID),
+        (b"a=1&workspace_id=12345678123456781234567812345678", WORKSPACE_ID),
+        (b"workspace_id=1234567-81234-5678-1234-567812345678", None),
+        (b"workspace_id=not-a-uuid", None),
+        (b"workspace_id=%E2%82%AC", None),  # decodes outside latin-1
+        (b"", None),
+    ],
+)
+async def test_workspace_id_from_query(query_string, expected):
+    scope = await _run(query_string=query_string)
+    assert scope["state"]["workspace_id"] == expected
+
+
+@pytest.mark.asyncio
+async def test_header_takes_precedence_over_query():
+    scope = await _run(
+        query_string=b"workspace_id=%E2%82%AC",
+        headers=[(b"x-workspace-id", str(WORKSPACE_ID).encode())],
+    )
+    assert scope["state"]["workspace_id"] == WORKSPACE_ID
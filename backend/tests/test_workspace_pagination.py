@@ -0,0 +1,133 @@
+"""Tests for keyset pagination of workspace and member listings."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+from app.services.workspace import WorkspaceService
+from app.utils.helpers import uuid7
+from app.utils.security import create_access_token
+
+# Several rows share a created_at, so pages must break ties on id
+CREATED_AT = [datetime(2026, 1, 1) + timedelta(minutes=minutes) for minutes in (0, 1, 1, 1, 2)]
+
+
+async def _user(db_session) -> User:
+    user = User(email=f"{uuid7().hex}@example.com", name="Pager")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def _owned_workspaces(db_session, owner: User) -> list:
+    workspaces = []
+    for index, created_at in enumerate(CREATED_AT):
+        workspace = Workspace(
+            name=f"Workspace {index}",
+            slug=f"pager-{uuid7().hex}",
+            owner_id=owner.id,
+            created_at=created_at,
+        )
+        workspace.members.append(
+            WorkspaceMember(user_id=owner.id, role=WorkspaceRole.OWNER, created_at=created_at)
+        )
+        db_session.add(workspace)
+        workspaces.append(workspace)
+    await db_session.flush()
+    return workspaces
+
+
+def _auth(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user.token_claims)}"}
+
+
+async def test_list_workspaces_follows_next_links_across_ties(client, db_session):
+    owner = await _user(db_session)
+    workspaces = await _owned_workspaces(db_session, owner)
+    expected = [
+        str(workspace.id)
+        for workspace in sorted(workspaces, key=lambda w: (w.created_at, w.id), reverse=True)
+    ]
+
+    seen, pages = [], 0
+    url = "/api/external/workspaces?limit=2"
+    while url:
+        response = await client.get(url, headers=_auth(owner))
+        assert response.status_code == 200
+        seen.extend(workspace["id"] for workspace in response.json())
+        pages += 1
+        url = response.links.get("next", {}).get("url")
+
+    assert seen == expected
+    # 2 + 2 + 1; the short last page has no next link
+    assert pages == 3
+
+
+async def test_list_workspaces_defaults_to_one_page(client, db_session):
+    owner = await _user(db_session)
+    await _owned_workspaces(db_session, owner)
+
+    response = await client.get("/api/external/workspaces", headers=_auth(owner))
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(CREATED_AT)
+    assert "link" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "after=2026-01-01T00:01:00",
+        f"after_id={uuid7()}",
+    ],
+)
+async def test_list_endpoints_require_both_cursor_parts(client, db_session, query):
+    owner = await _user(db_session)
+    workspace_id = uuid7()
+
+    for path in ("/api/external/workspaces", f"/api/external/workspaces/{workspace_id}/members"):
+        response = await client.get(f"{path}?{query}", headers=_auth(owner))
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "after and after_id must be given together"
+
+
+async def test_aware_cursor_is_accepted(client, db_session):
+    owner = await _user(db_session)
+    workspaces = await _owned_workspaces(db_session, owner)
+    newest = max(workspaces, key=lambda w: (w.created_at, w.id))
+
+    response = await client.get(
+        "/api/external/workspaces",
+        params={"after": f"{newest.created_at.isoformat()}+00:00", "after_id": str(newest.id)},
+        headers=_auth(owner),
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(CREATED_AT) - 1
+
+
+async def test_get_workspace_members_pages_across_ties(db_session):
+    owner = await _user(db_session)
+    workspace = Workspace(name="Members", slug=f"pager-{uuid7().hex}", owner_id=owner.id)
+    db_session.add(workspace)
+    members = []
+    for created_at in CREATED_AT:
+        user = await _user(db_session)
+        member = WorkspaceMember(workspace_id=workspace.id, user_id=user.id, created_at=created_at)
+        db_session.add(member)
+        members.append(member)
+    await db_session.flush()
+    expected = [m.id for m in sorted(members, key=lambda m: (m.created_at, m.id))]
+
+    service = WorkspaceService(db_session)
+    seen, after = [], None
+    while True:
+        page = await service.get_workspace_members(workspace.id, limit=2, after=after)
+        if not page:
+            break
+        seen.extend(row.id for row in page)
+        after = (page[-1].created_at, page[-1].id)
+
+    assert seen == expected
@@ -1,23 +1,41 @@
 """Example Analytics Plugin - Lifecycle Hooks."""
-from typing import Any
+import asyncio
+from typing import Any, Set
 from loguru import logger
 
+# Strong references to in-flight background tasks; the event loop only keeps
+# weak ones, so an unreferenced task could be garbage collected mid-run
+_background_tasks: Set[asyncio.Task] = set()
+
+# Bound once; records carry extra["plugin"] for sinks that filter on it
+_log_login = logger.bind(plugin="example-analytics").info
+
+
+async def _record_login(email: str) -> None:
+    """Record a login event outside the login request."""
+    _log_login("[Example Analytics] User logged in: {}", email)
+
+    # Example: Track login in analytics
+    # await track_event("user_login", {
+    #     "user_id": user_id,
+    #     "email": email,
+    #     "timestamp": utcnow(),
+    # })
+
 
 async def on_user_login(user: Any) -> None:
     """
     Hook called when a user logs in.
 
     This example hook logs the login event. In a real plugin,
-    you might track this in an analytics database.
+    you might track this in an analytics database. The work is
+    scheduled as a background task so the login response is not
+    held up by it.
 
     Args:
         user: User object who logged in
     """
-    logger.info(f"[Example Analytics] User logged in: {user.email}")
-
-    # Example: Track login in analytics
-    # await track_event("user_login", {
-    #     "user_id": user.id,
-    #     "email": user.email,
-    #     "timestamp": datetime.utcnow(),
-    # })
+    # Read attributes now; the user's session may be closed by the time the task runs
+    task = asyncio.create_task(_record_login(user.email))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
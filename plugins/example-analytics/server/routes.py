@@ -1,18 +1,28 @@
 """Example Analytics Plugin - API Routes."""
-from typing import Dict, Any
-from fastapi import Depends
+import orjson
+from fastapi import Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 # These imports would be available when plugin is loaded
 # from app.api.deps import get_current_user, get_db
 # from app.models.user import User
+# from app.models.workspace import Workspace
+
+# Mock data for example, serialized once at import
+_STATS_BODY = orjson.dumps({
+    "total_users": 150,
+    "active_users": 89,
+    "total_api_calls": 25430,
+    "total_workspaces": 12,
+    "period": "last_30_days"
+})
 
 
 async def get_stats(
     # db: AsyncSession = Depends(get_db),
     # current_user = Depends(get_current_user),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get analytics statistics.
 
@@ -20,18 +30,18 @@ async def get_stats(
     for analytics data.
 
     Returns:
-        Dict containing analytics stats
+        JSON response containing analytics stats
     """
-    # Example implementation (would use actual database queries)
-    # query = select(func.count(User.id)).where(User.is_active == True)
-    # result = await db.execute(query)
-    # active_users = result.scalar()
+    # Example implementation (would use actual database queries).
+    # Fetch every metric in one statement (one round trip) rather than
+    # one query per metric; counts over other tables are scalar subqueries.
+    # query = select(
+    #     func.count(User.id).label("total_users"),
+    #     func.count(User.id).filter(User.is_active.is_(True)).label("active_users"),
+    #     select(func.count(Workspace.id)).scalar_subquery().label("total_workspaces"),
+    # )
+    # stats = (await db.execute(query)).one()._asdict()
 
-    # Mock data for example
-    return {
-        "total_users": 150,
-        "active_users": 89,
-        "total_api_calls": 25430,
-        "total_workspaces": 12,
-        "period": "last_30_days"
-    }
+    # Mock data for example. A fresh Response per request, since FastAPI
+    # attaches background tasks to the returned instance.
+    return Response(content=_STATS_BODY, media_type="application/json")